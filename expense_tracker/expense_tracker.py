@@ -1,15 +1,95 @@
+import calendar
+import heapq
 import json
 import os
 import sys
 import argparse
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Any, Iterator, Optional
 
 EXPENSE_FILE = 'expenses.json'
+RECURRING_FILE = 'recurring.json'
+
+FREQUENCIES = ('monthly', 'weekly', 'days')
+
+def parse_date(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+def check_rule(rule: Dict[str, Any]):
+    """Raise ValueError if a stored recurring rule cannot be expanded"""
+    if rule.get('frequency') not in FREQUENCIES:
+        raise ValueError(f"unknown frequency {rule.get('frequency')!r}")
+    if not isinstance(rule.get('interval', 1), int) or rule.get('interval', 1) < 1:
+        raise ValueError("interval must be a whole number of at least 1")
+    start = parse_date(rule['start'])
+    if rule.get('end') and parse_date(rule['end']) < start:
+        raise ValueError("end date is before the start date")
+
+def occurrences(rule: Dict[str, Any], start: Optional[date], end: date) -> Iterator[date]:
+    """
+    Dates on which a recurring rule falls within [start, end], generated lazily.
+
+    The first occurrence in range is computed directly, so a schedule that has
+    run for years costs nothing before the requested range.
+    """
+    first = parse_date(rule['start'])
+    if rule.get('end'):
+        end = min(end, parse_date(rule['end']))
+    start = max(start, first) if start else first
+    interval = rule.get('interval', 1)
+
+    if rule['frequency'] == 'monthly':
+        # Months counted from year 0; the day is clamped for short months (31st -> 30th/28th)
+        first_month = first.year * 12 + first.month - 1
+        step = -(-(start.year * 12 + start.month - 1 - first_month) // interval)
+        while True:
+            year, month = divmod(first_month + step * interval, 12)
+            month += 1
+            occurrence = date(year, month, min(first.day, calendar.monthrange(year, month)[1]))
+            if occurrence > end:
+                return
+            if occurrence >= start:
+                yield occurrence
+            step += 1
+    else:
+        days = interval * (7 if rule['frequency'] == 'weekly' else 1)
+        occurrence = first + timedelta(days=-(-(start - first).days // days) * days)
+        step = timedelta(days=days)
+        while occurrence <= end:
+            yield occurrence
+            occurrence += step
 
 class ExpenseTracker:
     def __init__(self):
         self.expenses: List[Dict[str, Any]] = self.load_expenses()
+        # Rules that fail validation are skipped but written back untouched on save
+        self.invalid_recurring: List[Dict[str, Any]] = []
+        self.recurring: List[Dict[str, Any]] = self.load_recurring()
+
+    def load_recurring(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(RECURRING_FILE):
+            return []
+        try:
+            with open(RECURRING_FILE, 'r') as f:
+                rules = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return []
+
+        valid = []
+        for rule in rules:
+            try:
+                check_rule(rule)
+            except (KeyError, TypeError, ValueError) as e:
+                rule_id = rule.get('id', '?') if isinstance(rule, dict) else '?'
+                print(f"Warning: Skipping invalid recurring expense R{rule_id} in {RECURRING_FILE}: {e}")
+                self.invalid_recurring.append(rule)
+                continue
+            valid.append(rule)
+        return valid
+
+    def save_recurring(self):
+        with open(RECURRING_FILE, 'w') as f:
+            json.dump(self.recurring + self.invalid_recurring, f, indent=4)
 
     def load_expenses(self) -> List[Dict[str, Any]]:
         if not os.path.exists(EXPENSE_FILE):
@@ -67,30 +147,97 @@ class ExpenseTracker:
                 return
         print(f"Error: Expense with ID {expense_id} not found.")
 
-    def list_expenses(self):
+    def add_recurring(self, description: str, amount: float, frequency: str, interval: int = 1,
+                      start: Optional[date] = None, end: Optional[date] = None):
+        if amount < 0:
+            print("Error: Amount cannot be negative.")
+            return
+        if interval < 1:
+            print("Error: Interval must be at least 1.")
+            return
+        start = start or date.today()
+        if end and end < start:
+            print("Error: End date is before the start date.")
+            return
+
+        existing = [r['id'] for r in self.recurring + self.invalid_recurring if isinstance(r, dict) and 'id' in r]
+        rule_id = max(existing, default=0) + 1
+        rule = {
+            'id': rule_id,
+            'description': description,
+            'amount': amount,
+            'frequency': frequency,
+            'interval': interval,
+            'start': start.strftime("%Y-%m-%d"),
+            'end': end.strftime("%Y-%m-%d") if end else None
+        }
+        self.recurring.append(rule)
+        self.save_recurring()
+        print(f"Recurring expense added successfully (ID: R{rule_id})")
+
+    def delete_recurring(self, rule_id: int):
+        for rules in (self.recurring, self.invalid_recurring):
+            for i, rule in enumerate(rules):
+                if isinstance(rule, dict) and rule.get('id') == rule_id:
+                    del rules[i]
+                    self.save_recurring()
+                    print("Recurring expense deleted successfully")
+                    return
+        print(f"Error: Recurring expense with ID R{rule_id} not found.")
+
+    def list_recurring(self):
+        print(f"{'ID':<5} {'Description':<20} {'Amount':<10} {'Schedule':<18} {'Start':<12} {'End':<12}")
+        for rule in self.recurring:
+            unit = {'monthly': 'month', 'weekly': 'week', 'days': 'day'}[rule['frequency']]
+            interval = rule.get('interval', 1)
+            schedule = f"every {unit}" if interval == 1 else f"every {interval} {unit}s"
+            print(f"R{rule['id']:<4} {rule['description']:<20} ${rule['amount']:<9} {schedule:<18} "
+                  f"{rule['start']:<12} {rule.get('end') or '-':<12}")
+
+    def iter_expenses(self, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Concrete and recurring expenses in [start, end], in date order.
+
+        Recurring rules are expanded on the fly (up to today when no end is
+        given) and merged with the stored rows in a single heapq.merge pass,
+        so no occurrence is ever written to disk.
+        """
+        start_text = start.strftime("%Y-%m-%d") if start else None
+        end_text = end.strftime("%Y-%m-%d") if end else None
+        concrete = sorted(
+            (e for e in self.expenses
+             if (start_text is None or e['date'] >= start_text) and (end_text is None or e['date'] <= end_text)),
+            key=lambda e: e['date']
+        )
+
+        def expand(rule: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+            for day in occurrences(rule, start, end or date.today()):
+                yield {
+                    'id': f"R{rule['id']}",
+                    'date': day.strftime("%Y-%m-%d"),
+                    'description': rule['description'],
+                    'amount': rule['amount']
+                }
+
+        return heapq.merge(concrete, *(expand(rule) for rule in self.recurring), key=lambda e: e['date'])
+
+    def list_expenses(self, start: Optional[date] = None, end: Optional[date] = None):
         print(f"{'ID':<5} {'Date':<12} {'Description':<20} {'Amount':<10}")
-        for expense in self.expenses:
+        for expense in self.iter_expenses(start, end):
             print(f"{expense['id']:<5} {expense['date']:<12} {expense['description']:<20} ${expense['amount']:<10}")
 
     def summary(self, month: int = None):
         total = 0
-        filtered_expenses = []
         
         if month:
             current_year = datetime.now().year
-            for expense in self.expenses:
-                try:
-                    expense_date = datetime.strptime(expense['date'], "%Y-%m-%d")
-                    if expense_date.month == month and expense_date.year == current_year:
-                        filtered_expenses.append(expense)
-                except ValueError:
-                    continue 
-            
-            total = sum(e['amount'] for e in filtered_expenses)
+            start = date(current_year, month, 1)
+            end = date(current_year, month, calendar.monthrange(current_year, month)[1])
+            total = sum(e['amount'] for e in self.iter_expenses(start, end))
             month_name = datetime(current_year, month, 1).strftime("%B")
             print(f"Total expenses for {month_name}: ${total}")
         else:
-            total = sum(e['amount'] for e in self.expenses)
+            total = sum(e['amount'] for e in self.iter_expenses())
             print(f"Total expenses: ${total}")
 def print_usage():
     print("Usage: expense_tracker.py [command] [options]\n\n\n")
@@ -100,6 +247,9 @@ def print_usage():
     print("  delete - Delete an expense")
     print("  list - List all expenses")
     print("  summary - Show summary of expenses")
+    print("  add-recurring - Add a recurring expense (monthly, weekly or every N days)")
+    print("  list-recurring - List recurring expenses")
+    print("  delete-recurring - Delete a recurring expense")
 
     print("\n\n\n===================Example===================")
     print("[ADD]  expense_tracker.py add --description 'Groceries' --amount 100")
@@ -107,6 +257,7 @@ def print_usage():
     print("[DELETE]  expense_tracker.py delete --id 1")
     print("[LIST]  expense_tracker.py list")
     print("[SUMMARY]  expense_tracker.py summary --month 1")
+    print("[RECURRING]  expense_tracker.py add-recurring --description 'Rent' --amount 1500 --frequency monthly --start 2026-01-31")
 
 def main():
     # parser = argparse.parse_args()
@@ -134,10 +285,30 @@ def main():
 
     # List
     parser_list = subparsers.add_parser('list', help='List all expenses')
+    parser_list.add_argument('--from', dest='start', type=parse_date, help='First date to list (YYYY-MM-DD)')
+    parser_list.add_argument('--to', dest='end', type=parse_date,
+                             help='Last date to list (YYYY-MM-DD, default: recurring expenses up to today)')
 
     # Summary
     parser_summary = subparsers.add_parser('summary', help='Show summary of expenses')
-    parser_summary.add_argument('--month', type=int, help='Month number (1-12) for summary')
+    parser_summary.add_argument('--month', type=int, choices=range(1, 13), metavar='MONTH',
+                                help='Month number (1-12) for summary')
+
+    # Recurring
+    parser_add_recurring = subparsers.add_parser('add-recurring', help='Add a recurring expense')
+    parser_add_recurring.add_argument('--description', required=True, help='Description of the expense')
+    parser_add_recurring.add_argument('--amount', type=float, required=True, help='Amount of each occurrence')
+    parser_add_recurring.add_argument('--frequency', choices=FREQUENCIES, required=True,
+                                      help='monthly, weekly, or days (every --interval days)')
+    parser_add_recurring.add_argument('--interval', type=int, default=1,
+                                      help='Repeat every N months/weeks/days (default: 1)')
+    parser_add_recurring.add_argument('--start', type=parse_date, help='First occurrence (YYYY-MM-DD, default: today)')
+    parser_add_recurring.add_argument('--end', type=parse_date, help='Last possible occurrence (YYYY-MM-DD, default: none)')
+
+    subparsers.add_parser('list-recurring', help='List recurring expenses')
+
+    parser_delete_recurring = subparsers.add_parser('delete-recurring', help='Delete a recurring expense')
+    parser_delete_recurring.add_argument('--id', type=int, required=True, help='ID of the recurring expense (number after R)')
 
     args = main_parser.parse_args()
     tracker = ExpenseTracker()
@@ -149,9 +320,15 @@ def main():
     elif args.command == 'delete':
         tracker.delete_expense(args.id)
     elif args.command == 'list':
-        tracker.list_expenses()
+        tracker.list_expenses(args.start, args.end)
     elif args.command == 'summary':
         tracker.summary(args.month)
+    elif args.command == 'add-recurring':
+        tracker.add_recurring(args.description, args.amount, args.frequency, args.interval, args.start, args.end)
+    elif args.command == 'list-recurring':
+        tracker.list_recurring()
+    elif args.command == 'delete-recurring':
+        tracker.delete_recurring(args.id)
     else:
         print_usage()
 
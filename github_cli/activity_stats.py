@@ -0,0 +1,206 @@
+"""
+Activity Statistics
+Single-pass statistics engine for GitHub events
+"""
+
+import heapq
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+@lru_cache(maxsize=4096)
+def _is_day(day: str) -> bool:
+    """Apakah string 'YYYY-MM-DD' adalah tanggal yang valid (di-cache, karena tanggal banyak berulang)"""
+    if day[4:5] != '-' or day[7:8] != '-':
+        return False
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        return False
+    return True
+
+
+def _split_timestamp(created_at: str) -> Optional[Tuple[str, int]]:
+    """
+    Mengambil tanggal (YYYY-MM-DD) dan jam (UTC) dari timestamp event
+
+    Timestamp GitHub selalu berformat 'YYYY-MM-DDTHH:MM:SSZ', sehingga cukup
+    di-slice setelah jam dan tanggalnya dicek; selain itu di-parse dengan
+    fromisoformat.
+
+    Args:
+        created_at: Timestamp dari field 'created_at'
+
+    Returns:
+        Tuple[str, int]: (tanggal, jam) atau None jika tidak valid
+    """
+    if len(created_at) >= 13 and created_at[10] == 'T' and created_at[11:13].isdigit():
+        hour = int(created_at[11:13])
+        if hour < 24 and _is_day(created_at[:10]):
+            return created_at[:10], hour
+    try:
+        dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+    return dt.date().isoformat(), dt.hour
+
+
+def top_k(counts: Dict[str, int], k: int) -> List[Tuple[str, int]]:
+    """
+    Mengambil k entri dengan jumlah terbesar tanpa mengurutkan seluruh dict
+
+    Args:
+        counts: Mapping key -> jumlah
+        k: Jumlah entri yang diambil
+
+    Returns:
+        List[Tuple[str, int]]: Entri teratas, urut menurun
+    """
+    return heapq.nlargest(k, counts.items(), key=lambda item: item[1])
+
+
+class ActivityStatistics:
+    """
+    Akumulator statistik aktivitas yang dihitung dalam satu kali iterasi
+
+    Hasil dari beberapa akumulator (mis. per file atau per user) bisa
+    digabungkan dengan merge().
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.commits = 0
+        self.event_counts: Counter = Counter()
+        self.repo_counts: Counter = Counter()
+        self.repo_events: Dict[str, Counter] = defaultdict(Counter)
+        self.hourly: List[int] = [0] * 24
+        self.daily: Counter = Counter()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        """
+        Menambahkan satu event ke statistik
+
+        Args:
+            event: Data event dari GitHub API atau dump
+        """
+        event_type = event.get('type', 'Unknown')
+        repo_name = (event.get('repo') or {}).get('name', 'Unknown')
+
+        self.total += 1
+        self.event_counts[event_type] += 1
+        self.repo_counts[repo_name] += 1
+        self.repo_events[repo_name][event_type] += 1
+
+        if event_type == 'PushEvent':
+            payload = event.get('payload') or {}
+            self.commits += payload.get('size', len(payload.get('commits') or []))
+
+        when = _split_timestamp(event.get('created_at') or '')
+        if when is not None:
+            day, hour = when
+            self.daily[day] += 1
+            self.hourly[hour] += 1
+
+    def update(self, events: Iterable[Dict[str, Any]]) -> 'ActivityStatistics':
+        """
+        Menambahkan banyak event sekaligus
+
+        Args:
+            events: Iterable event
+
+        Returns:
+            ActivityStatistics: self, agar bisa dirangkai
+        """
+        add = self.add
+        for event in events:
+            add(event)
+        return self
+
+    def merge(self, other: 'ActivityStatistics') -> 'ActivityStatistics':
+        """
+        Menggabungkan statistik lain ke statistik ini
+
+        Args:
+            other: Statistik yang akan digabungkan
+
+        Returns:
+            ActivityStatistics: self, agar bisa dirangkai
+        """
+        self.total += other.total
+        self.commits += other.commits
+        self.event_counts.update(other.event_counts)
+        self.repo_counts.update(other.repo_counts)
+        for repo_name, counts in other.repo_events.items():
+            self.repo_events[repo_name].update(counts)
+        self.hourly = [a + b for a, b in zip(self.hourly, other.hourly)]
+        self.daily.update(other.daily)
+        return self
+
+    def top_repositories(self, k: int = 5) -> List[Tuple[str, int]]:
+        """Mengambil k repository dengan event terbanyak"""
+        return top_k(self.repo_counts, k)
+
+    def top_event_types(self, k: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Mengambil k event type terbanyak (semua jika k tidak diberikan)"""
+        return top_k(self.event_counts, len(self.event_counts) if k is None else k)
+
+    def top_days(self, k: int = 5) -> List[Tuple[str, int]]:
+        """Mengambil k hari dengan aktivitas terbanyak"""
+        return top_k(self.daily, k)
+
+    def streaks(self, today: Optional[date] = None) -> Tuple[int, int]:
+        """
+        Menghitung streak hari aktif berturut-turut
+
+        Streak saat ini hanya dihitung jika berakhir hari ini atau kemarin
+        (hari ini mungkin belum ada aktivitas); selain itu nilainya 0.
+
+        Args:
+            today: Tanggal acuan (default: hari ini dalam UTC, sama dengan timestamp event)
+
+        Returns:
+            Tuple[int, int]: (streak terpanjang, streak saat ini)
+        """
+        if not self.daily:
+            return 0, 0
+
+        days = sorted(date.fromisoformat(day) for day in self.daily)
+        longest = run = 1
+        for previous, day in zip(days, days[1:]):
+            if day - previous == timedelta(days=1):
+                run += 1
+                longest = max(longest, run)
+            else:
+                run = 1
+
+        if today is None:
+            today = datetime.now(timezone.utc).date()
+        current = run if today - days[-1] <= timedelta(days=1) else 0
+        return longest, current
+
+    def to_dict(self, top_n: int = 5) -> Dict[str, Any]:
+        """
+        Mengubah statistik menjadi struktur data yang bisa di-serialize ke JSON
+
+        Args:
+            top_n: Jumlah repository dan hari teratas yang disertakan
+
+        Returns:
+            Dict: Ringkasan statistik
+        """
+        longest, current = self.streaks()
+        return {
+            'total': self.total,
+            'commits': self.commits,
+            'events_by_type': dict(self.top_event_types()),
+            'top_repositories': [
+                {'repo': repo, 'events': count, 'by_type': dict(self.repo_events[repo])}
+                for repo, count in self.top_repositories(top_n)
+            ],
+            'top_days': dict(self.top_days(top_n)),
+            'hourly': list(self.hourly),
+            'longest_streak': longest,
+            'current_streak': current,
+        }
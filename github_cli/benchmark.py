@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+GitHub Activity Benchmark
+Measures the fetch -> parse -> format -> stats pipeline against a local mock API
+"""
+
+import re
+import time
+import argparse
+import statistics
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from activity_stats import ActivityStatistics
+from github_activity import GitHubActivityCLI, GitHubActivityError, format_timestamp
+from mock_server import MockGitHubServer, generate_events
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Menghitung persentil dengan metode nearest-rank
+
+    Args:
+        samples: Sampel yang sudah diurutkan
+        pct: Persentil (0-100)
+
+    Returns:
+        float: Nilai persentil
+    """
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def run_pipeline(username: str, api_base: str) -> int:
+    """
+    Menjalankan satu iterasi pipeline lengkap untuk satu user
+
+    Returns:
+        int: Jumlah event yang diproses
+    """
+    cli = GitHubActivityCLI(username, api_base)
+    activities = cli.load_activities()
+    for activity in activities:
+        cli.format_activity(activity)
+        cli.additional_info_lines(activity)
+    ActivityStatistics().update(activities)
+    return len(activities)
+
+
+def bench_fetch(api_base: str, requests: int, concurrency: int, users: int) -> Dict[str, float]:
+    """
+    Mengukur throughput dan tail latency pipeline di bawah concurrency
+
+    Returns:
+        Dict: Hasil pengukuran
+    """
+    usernames = [f"bench-user-{i}" for i in range(users)]
+    latencies: List[float] = []
+    errors = 0
+    events = 0
+
+    def one(i: int):
+        start = time.perf_counter()
+        try:
+            count = run_pipeline(usernames[i % users], api_base)
+        except GitHubActivityError:
+            return None, time.perf_counter() - start
+        return count, time.perf_counter() - start
+
+    # Warm-up agar halaman mock sudah di-cache sebelum diukur
+    for username in usernames:
+        try:
+            run_pipeline(username, api_base)
+        except GitHubActivityError:
+            pass
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for count, elapsed in executor.map(one, range(requests)):
+            latencies.append(elapsed)
+            if count is None:
+                errors += 1
+            else:
+                events += count
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'requests': requests,
+        'errors': errors,
+        'wall_s': wall,
+        'req_per_s': requests / wall,
+        'events_per_s': events / wall,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+NEXT_LINK = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def get_page(url: str, etag: Optional[str] = None) -> Tuple[int, bytes, Dict[str, str]]:
+    """
+    Satu GET mentah ke mock server, opsional dengan If-None-Match
+
+    Returns:
+        Tuple: (status, body, headers)
+    """
+    headers = {'User-Agent': 'GitHub-Activity-Benchmark/1.0'}
+    if etag:
+        headers['If-None-Match'] = etag
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=10) as response:
+            return response.status, response.read(), dict(response.headers)
+    except urllib.error.HTTPError as e:
+        # urllib melaporkan 304 sebagai HTTPError
+        return e.code, b'', dict(e.headers)
+
+
+def crawl_pages(api_base: str, username: str) -> List[Tuple[str, str]]:
+    """
+    Mengikuti header Link rel="next" dari halaman pertama sampai habis
+
+    Returns:
+        List[Tuple]: (url, etag) untuk setiap halaman
+    """
+    pages = []
+    url: Optional[str] = f"{api_base.rstrip('/')}/users/{username}/events"
+    while url:
+        status, _, headers = get_page(url)
+        if status != 200:
+            raise RuntimeError(f"GET {url} returned {status}")
+        pages.append((url, headers.get('ETag', '')))
+        match = NEXT_LINK.search(headers.get('Link', ''))
+        url = match.group(1) if match else None
+    return pages
+
+
+def bench_revalidate(api_base: str, requests: int, concurrency: int, users: int,
+                     expected_pages: Optional[int] = None) -> Dict[str, float]:
+    """
+    Mengukur paging (rel="next") dan revalidasi bersyarat (If-None-Match -> 304)
+
+    Setiap user di-crawl sampai halaman terakhir, lalu semua halaman diminta
+    ulang dengan ETag-nya. Jumlah halaman yang tidak sesuai expected_pages
+    (jika diberikan) dan jawaban selain 304 dihitung sebagai mismatch.
+
+    Returns:
+        Dict: Hasil pengukuran
+    """
+    start = time.perf_counter()
+    crawled = [crawl_pages(api_base, f"bench-user-{i}") for i in range(users)]
+    crawl_wall = time.perf_counter() - start
+    mismatches = sum(len(pages) != expected_pages for pages in crawled) if expected_pages else 0
+    pages = [page for user_pages in crawled for page in user_pages]
+
+    def one(i: int) -> Tuple[int, float]:
+        url, etag = pages[i % len(pages)]
+        begin = time.perf_counter()
+        status, _, _ = get_page(url, etag)
+        return status, time.perf_counter() - begin
+
+    latencies: List[float] = []
+    not_modified = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for status, elapsed in executor.map(one, range(requests)):
+            latencies.append(elapsed)
+            not_modified += status == 304
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'pages': len(pages),
+        'crawl_pages_per_s': len(pages) / crawl_wall,
+        'req_per_s': requests / wall,
+        'not_modified': not_modified,
+        'mismatches': mismatches + requests - not_modified,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def bench_stage(name: str, func: Callable[[], int], repeat: int) -> Dict[str, float]:
+    """
+    Mengukur satu tahap pipeline secara offline (tanpa HTTP)
+
+    Returns:
+        Dict: Event per detik (median dari beberapa percobaan)
+    """
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func()
+        rates.append(count / (time.perf_counter() - start))
+    return {'stage': name, 'events_per_s': statistics.median(rates)}
+
+
+def offline_stages(events_count: int, repeat: int) -> List[Dict[str, float]]:
+    """Mengukur tahap format dan statistik dengan event sintetis"""
+    events = generate_events('bench-offline', events_count)
+    cli = GitHubActivityCLI('bench-offline')
+
+    def fmt() -> int:
+        format_timestamp.cache_clear()
+        for event in events:
+            cli.format_activity(event)
+            cli.additional_info_lines(event)
+        return len(events)
+
+    def stats() -> int:
+        ActivityStatistics().update(events)
+        return len(events)
+
+    return [bench_stage('format', fmt, repeat), bench_stage('stats', stats, repeat)]
+
+
+def main():
+    """
+    Fungsi utama untuk menjalankan benchmark
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the GitHub activity pipeline offline")
+    parser.add_argument('--url', help='Use an already running mock server instead of an in-process one')
+    parser.add_argument('--requests', type=int, default=500, help='Pipeline runs to measure (default: 500)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16],
+                        help='Concurrency levels to measure (default: 1 4 16)')
+    parser.add_argument('--users', type=int, default=20, help='Distinct users to cycle through (default: 20)')
+    parser.add_argument('--events', type=int, default=30, help='Events per user page (default: 30)')
+    parser.add_argument('--pages', type=int, default=3,
+                        help='Pages per user for the paging/revalidation scenario (default: 3)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Mock server latency in ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Mock server 502 rate')
+    parser.add_argument('--offline-events', type=int, default=50000,
+                        help='Synthetic events for the offline stage benchmark (default: 50000)')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions per offline stage (default: 5)')
+    args = parser.parse_args()
+
+    print("Offline stages:")
+    for result in offline_stages(args.offline_events, args.repeat):
+        print(f"  {result['stage']:<8} {result['events_per_s']:>12,.0f} events/s")
+
+    server = None
+    api_base = args.url
+    if api_base is None:
+        server = MockGitHubServer(per_page=args.events, latency=args.latency / 1000,
+                                  error_rate=args.error_rate, synthetic=args.events * args.pages).start()
+        api_base = server.url
+
+    try:
+        print(f"\nFetch pipeline against {api_base}:")
+        print(f"  {'conc':>4} {'req/s':>9} {'events/s':>11} {'p50 ms':>8} "
+              f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>6}")
+        for concurrency in args.concurrency:
+            r = bench_fetch(api_base, args.requests, concurrency, args.users)
+            print(f"  {concurrency:>4} {r['req_per_s']:>9,.1f} {r['events_per_s']:>11,.0f} "
+                  f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+                  f"{r['max_ms']:>8.2f} {r['errors']:>6}")
+
+        if args.error_rate:
+            print("\nPaging and conditional requests: skipped (needs --error-rate 0)")
+            return
+        print('\nPaging (rel="next") and conditional requests (If-None-Match):')
+        print(f"  {'conc':>4} {'pages':>6} {'crawl p/s':>10} {'304 req/s':>10} "
+              f"{'p50 ms':>8} {'p99 ms':>8} {'mismatch':>8}")
+        for concurrency in args.concurrency:
+            # An external --url serves however many pages it has
+            r = bench_revalidate(api_base, args.requests, concurrency, args.users,
+                                 None if args.url else args.pages)
+            print(f"  {concurrency:>4} {r['pages']:>6} {r['crawl_pages_per_s']:>10,.1f} "
+                  f"{r['req_per_s']:>10,.1f} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['mismatches']:>8}")
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+GH Archive Analyzer
+Offline analysis of GH Archive-style event dumps (gzipped JSON-lines)
+"""
+
+import sys
+import gzip
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from activity_stats import ActivityStatistics
+from github_activity import print_statistics
+
+
+def open_dump(path: str):
+    """
+    Membuka file dump dalam mode biner
+
+    File .gz didekompresi secara bertahap saat dibaca, sehingga isi file
+    tidak pernah dimuat seluruhnya ke memori.
+
+    Args:
+        path: Path ke file .json.gz atau .json
+
+    Returns:
+        File object biner yang bisa diiterasi per baris
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def iter_events(path: str, user: Optional[str] = None, repo: Optional[str] = None,
+                event_type: Optional[str] = None, stats: Optional[Dict[str, int]] = None
+                ) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming event dari satu file dump dengan filter opsional
+
+    Baris yang tidak mengandung nilai filter sama sekali dilewati sebelum
+    di-parse, karena json.loads adalah bagian termahal dari loop ini.
+
+    Args:
+        path: Path ke file dump
+        user: Filter berdasarkan login actor
+        repo: Filter berdasarkan nama repository (owner/name)
+        event_type: Filter berdasarkan event type (mis. PushEvent)
+        stats: Dict opsional untuk mencatat jumlah baris yang rusak ('skipped')
+
+    Yields:
+        Dict: Event yang lolos filter
+    """
+    needles = [json.dumps(value).encode('utf-8') for value in (user, repo, event_type) if value]
+
+    with open_dump(path) as f:
+        for line in f:
+            if needles and not all(needle in line for needle in needles):
+                continue
+            try:
+                event = json.loads(line)
+            except ValueError:
+                # JSONDecodeError and UnicodeDecodeError (bytes that are not UTF-8)
+                event = None
+            if not isinstance(event, dict):
+                if stats is not None:
+                    stats['skipped'] = stats.get('skipped', 0) + 1
+                continue
+
+            if user and (event.get('actor') or {}).get('login') != user:
+                continue
+            if repo and (event.get('repo') or {}).get('name') != repo:
+                continue
+            if event_type and event.get('type') != event_type:
+                continue
+            yield event
+
+
+def scan_dump(path: str, user: Optional[str] = None, repo: Optional[str] = None,
+              event_type: Optional[str] = None) -> Tuple[ActivityStatistics, int]:
+    """
+    Menghitung statistik untuk satu file dump
+
+    Args:
+        path: Path ke file dump
+        user: Filter berdasarkan login actor
+        repo: Filter berdasarkan nama repository
+        event_type: Filter berdasarkan event type
+
+    Returns:
+        Tuple[ActivityStatistics, int]: Statistik dan jumlah baris yang rusak
+    """
+    skipped = {'skipped': 0}
+    stats = ActivityStatistics().update(iter_events(path, user, repo, event_type, skipped))
+    return stats, skipped['skipped']
+
+
+def analyze_dumps(paths: List[str], user: Optional[str] = None, repo: Optional[str] = None,
+                  event_type: Optional[str] = None, workers: Optional[int] = None
+                  ) -> Tuple[ActivityStatistics, int]:
+    """
+    Menghitung statistik untuk banyak file dump secara paralel
+
+    Setiap file diproses oleh satu worker di process pool, lalu hasilnya
+    digabungkan. Dengan satu file atau workers=1 semua berjalan di proses ini.
+
+    Args:
+        paths: Daftar path file dump
+        user: Filter berdasarkan login actor
+        repo: Filter berdasarkan nama repository
+        event_type: Filter berdasarkan event type
+        workers: Jumlah proses worker (default: jumlah CPU)
+
+    Returns:
+        Tuple[ActivityStatistics, int]: Statistik gabungan dan jumlah baris yang rusak
+    """
+    stats = ActivityStatistics()
+    skipped = 0
+
+    if len(paths) <= 1 or workers == 1:
+        partials = (scan_dump(path, user, repo, event_type) for path in paths)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        n = len(paths)
+        partials = executor.map(scan_dump, paths, [user] * n, [repo] * n, [event_type] * n)
+
+    try:
+        for partial, partial_skipped in partials:
+            stats.merge(partial)
+            skipped += partial_skipped
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return stats, skipped
+
+
+def main():
+    """
+    Fungsi utama untuk menjalankan analyzer
+    """
+    parser = argparse.ArgumentParser(description="Analyze GH Archive-style event dumps offline")
+    parser.add_argument('paths', nargs='+', help='One or more .json.gz (or .json) dump files')
+    parser.add_argument('--user', help='Only count events by this actor login')
+    parser.add_argument('--repo', help='Only count events in this repository (owner/name)')
+    parser.add_argument('--type', dest='event_type', help='Only count this event type (e.g. PushEvent)')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--top', type=int, default=5, help='Number of top repositories to show (default: 5)')
+    args = parser.parse_args()
+
+    try:
+        stats, skipped = analyze_dumps(args.paths, args.user, args.repo, args.event_type, args.workers)
+    except (OSError, EOFError) as e:
+        print(f"Error: Could not read dump - {e}")
+        sys.exit(1)
+
+    if not stats.total:
+        print("No matching events found")
+    else:
+        print_statistics(stats, top_n=args.top)
+        print(f"\nTotal: {stats.total} events from {len(args.paths)} file(s)")
+    if skipped:
+        print(f"Skipped {skipped} malformed line(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,131 @@ GitHub Activity CLI
 A command-line tool to fetch and display recent GitHub user activity
 """
 
+import io
+import os
 import sys
+import csv
 import json
+import string
 import urllib.request
 import urllib.error
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, TextIO
+
+from activity_stats import ActivityStatistics, top_k
+
+
+OUTPUT_FORMATS = ('text', 'json', 'jsonl', 'csv')
+CSV_FIELDS = ('user', 'id', 'type', 'repo', 'created_at', 'message')
+
+
+# Base URL API bisa diarahkan ke server lain (mis. mock_server.py untuk benchmark)
+DEFAULT_API_URL = os.environ.get('GITHUB_API_URL', 'https://api.github.com')
+
+
+class GitHubActivityError(Exception):
+    """Error saat mengambil aktivitas dari GitHub API"""
+
+
+# Ekstraksi nilai placeholder {payload[...]} dari payload event
+PAYLOAD_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    # Events API memakai 'size', sedangkan payload lama hanya punya daftar 'commits'
+    'commits': lambda payload: payload.get('size', len(payload.get('commits') or [])),
+    'action': lambda payload: payload.get('action') or 'performed action on',
+    'ref_type': lambda payload: payload.get('ref_type') or 'ref',
+}
+
+
+def _compile_template(template: str) -> Callable[[str, Dict[str, Any]], str]:
+    """
+    Compile template pesan menjadi fungsi formatter
+
+    Template di-parse sekali, sehingga saat runtime hanya tersisa
+    penggabungan potongan literal dan nilai yang diambil dari payload.
+
+    Args:
+        template: Template dari EVENT_TYPE_MESSAGES
+
+    Returns:
+        Callable: Fungsi (repo_name, payload) -> pesan
+    """
+    parts = []
+    for literal, field, _, _ in string.Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if field == 'repo[name]':
+            parts.append(None)
+        elif field.startswith('payload[') and field.endswith(']'):
+            key = field[len('payload['):-1]
+            parts.append(PAYLOAD_EXTRACTORS.get(key, lambda payload, key=key: payload.get(key, key)))
+        else:
+            raise ValueError(f"Unsupported placeholder '{field}' in template '{template}'")
+
+    def formatter(repo_name: str, payload: Dict[str, Any]) -> str:
+        message = ''.join(
+            part if isinstance(part, str) else repo_name if part is None else str(part(payload))
+            for part in parts
+        )
+        return message[:1].upper() + message[1:]
+
+    return formatter
+
+
+@lru_cache(maxsize=4096)
+def format_timestamp(created_at: str) -> str:
+    """
+    Format timestamp ISO 8601 dari GitHub menjadi 'YYYY-MM-DD HH:MM'
+
+    Hasil di-cache karena event dalam jumlah besar sering berbagi timestamp.
+
+    Args:
+        created_at: Timestamp dari field 'created_at'
+
+    Returns:
+        str: Timestamp yang sudah diformat
+    """
+    if not created_at:
+        return 'Unknown time'
+    try:
+        dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        return dt.strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return created_at
+
+
+def _truncate(text: str, width: int) -> str:
+    """Potong teks ke lebar tertentu dan tambahkan '...' jika terpotong"""
+    return f"{text[:width]}{'...' if len(text) > width else ''}"
+
+
+def _push_details(payload: Dict[str, Any]) -> List[str]:
+    commits = payload.get('commits') or []
+    if not commits:
+        return []
+    lines = ["  Commits:"]
+    for commit in commits[-3:]:  # Tampilkan maksimal 3 commit terakhir
+        message = commit.get('message', '').split('\n')[0]
+        sha = commit.get('sha', '')[:7]
+        lines.append(f"    • {sha}: {_truncate(message, 50)}")
+    return lines
+
+
+def _issue_details(payload: Dict[str, Any]) -> List[str]:
+    issue = payload.get('issue') or {}
+    if not issue:
+        return []
+    return [f"  Issue: \"{_truncate(issue.get('title', ''), 60)}\""]
+
+
+def _pull_request_details(payload: Dict[str, Any]) -> List[str]:
+    pr = payload.get('pull_request') or {}
+    if not pr:
+        return []
+    return [f"  PR: \"{_truncate(pr.get('title', ''), 60)}\""]
 
 
 class GitHubActivityCLI:
@@ -37,26 +156,41 @@ class GitHubActivityCLI:
         'SponsorshipEvent': 'Sponsored {repo[name]}',
     }
     
-    def __init__(self, username: str):
+    # Registry formatter per event type, dibangun sekali saat class didefinisikan
+    EVENT_FORMATTERS = {
+        event_type: _compile_template(template)
+        for event_type, template in EVENT_TYPE_MESSAGES.items()
+    }
+    
+    # Informasi tambahan per event type
+    ADDITIONAL_INFO = {
+        'PushEvent': _push_details,
+        'IssuesEvent': _issue_details,
+        'PullRequestEvent': _pull_request_details,
+    }
+    
+    def __init__(self, username: str, api_base: Optional[str] = None):
         """
         Inisialisasi CLI dengan username GitHub
         
         Args:
             username: GitHub username yang akan diambil aktivitasnya
+            api_base: Base URL API (default: GITHUB_API_URL atau api.github.com)
         """
         self.username = username
-        self.api_url = f"https://api.github.com/users/{username}/events"
+        self.api_url = f"{(api_base or DEFAULT_API_URL).rstrip('/')}/users/{username}/events"
         self.activities = []
     
-    def fetch_activities(self) -> bool:
+    def load_activities(self) -> List[Dict[str, Any]]:
         """
-        Mengambil aktivitas dari GitHub API
+        Mengambil aktivitas dari GitHub API tanpa output ke terminal
         
         Returns:
-            bool: True jika berhasil, False jika gagal
+            List[Dict]: Daftar aktivitas (juga disimpan di self.activities)
+            
+        Raises:
+            GitHubActivityError: Jika request gagal atau response tidak valid
         """
-        print(f"Fetching activities for {self.username}...")
-        
         try:
             # Membuat request ke GitHub API
             request = urllib.request.Request(
@@ -68,88 +202,84 @@ class GitHubActivityCLI:
             )
             
             with urllib.request.urlopen(request, timeout=10) as response:
-                if response.status == 200:
-                    data = response.read()
-                    self.activities = json.loads(data.decode('utf-8'))
-                    return True
-                else:
-                    print(f"Error: Received status code {response.status}")
-                    return False
+                if response.status != 200:
+                    raise GitHubActivityError(f"Received status code {response.status}")
+                data = response.read()
+                self.activities = json.loads(data.decode('utf-8'))
+                return self.activities
                     
         except urllib.error.HTTPError as e:
             if e.code == 404:
-                print(f"Error: User '{self.username}' not found")
+                raise GitHubActivityError(f"User '{self.username}' not found") from e
             elif e.code == 403:
-                print("Error: API rate limit exceeded or access forbidden")
-                print("Try again later or use GitHub token for authentication")
-            else:
-                print(f"Error: HTTP {e.code} - {e.reason}")
-            return False
+                raise GitHubActivityError(
+                    "API rate limit exceeded or access forbidden\n"
+                    "Try again later or use GitHub token for authentication"
+                ) from e
+            raise GitHubActivityError(f"HTTP {e.code} - {e.reason}") from e
             
         except urllib.error.URLError as e:
-            print(f"Error: Could not connect to GitHub API - {e.reason}")
-            return False
+            raise GitHubActivityError(f"Could not connect to GitHub API - {e.reason}") from e
             
         except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON response - {e}")
-            return False
+            raise GitHubActivityError(f"Invalid JSON response - {e}") from e
+    
+    def fetch_activities(self, quiet: bool = False) -> bool:
+        """
+        Mengambil aktivitas dari GitHub API
+        
+        Args:
+            quiet: Jika True, pesan progres tidak ditampilkan
             
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        if not quiet:
+            print(f"Fetching activities for {self.username}...")
+        
+        try:
+            self.load_activities()
+            return True
+        except GitHubActivityError as e:
+            print(f"Error: {e}")
+            return False
         except Exception as e:
             print(f"Error: Unexpected error - {e}")
             return False
     
-    def format_activity(self, activity: Dict[str, Any]) -> str:
+    def format_message(self, activity: Dict[str, Any]) -> str:
         """
-        Format aktivitas individual menjadi string yang mudah dibaca
+        Membuat pesan aktivitas tanpa prefix dan timestamp
         
         Args:
             activity: Data aktivitas dari GitHub API
             
         Returns:
-            str: String yang sudah diformat
+            str: Pesan aktivitas
         """
         event_type = activity.get('type', 'UnknownEvent')
-        repo_name = activity.get('repo', {}).get('name', 'Unknown Repository')
-        payload = activity.get('payload', {})
-        
-        # Format timestamp
-        created_at = activity.get('created_at', '')
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                timestamp = dt.strftime('%Y-%m-%d %H:%M')
-            except:
-                timestamp = created_at
-        else:
-            timestamp = 'Unknown time'
+        repo_name = (activity.get('repo') or {}).get('name', 'Unknown Repository')
         
-        # Cek apakah event type ada di mapping
-        if event_type in self.EVENT_TYPE_MESSAGES:
-            try:
-                # Gunakan string formatting dengan data dari aktivitas
-                message = self.EVENT_TYPE_MESSAGES[event_type]
-                
-                # Handle kasus khusus untuk beberapa event type
-                if event_type == 'PushEvent':
-                    # Hitung jumlah commit
-                    commits = len(payload.get('commits', []))
-                    message = message.replace('{payload[commits]}', str(commits))
-                elif event_type == 'IssuesEvent':
-                    # Format action (opened, closed, reopened)
-                    action = payload.get('action', 'performed action on')
-                    message = message.replace('{payload[action]}', action)
-                elif event_type == 'PullRequestEvent':
-                    action = payload.get('action', 'performed action on')
-                    message = message.replace('{payload[action]}', action)
-                
-                # Ganti placeholder dengan data aktual
-                message = message.replace('{repo[name]}', repo_name)
-                
-            except Exception:
-                message = f"{event_type} in {repo_name}"
-        else:
-            message = f"{event_type} in {repo_name}"
+        formatter = self.EVENT_FORMATTERS.get(event_type)
+        if formatter is None:
+            return f"{event_type} in {repo_name}"
+        try:
+            return formatter(repo_name, activity.get('payload') or {})
+        except Exception:
+            return f"{event_type} in {repo_name}"
+    
+    def format_activity(self, activity: Dict[str, Any]) -> str:
+        """
+        Format aktivitas individual menjadi string yang mudah dibaca
         
+        Args:
+            activity: Data aktivitas dari GitHub API
+            
+        Returns:
+            str: String yang sudah diformat
+        """
+        message = self.format_message(activity)
+        timestamp = format_timestamp(activity.get('created_at', ''))
         return f"- {message} ({timestamp})"
     
     def display_activities(self, max_activities: int = 10):
@@ -187,29 +317,23 @@ class GitHubActivityCLI:
         Args:
             activity: Data aktivitas dari GitHub API
         """
-        event_type = activity.get('type', '')
-        payload = activity.get('payload', {})
-        
-        if event_type == 'PushEvent':
-            commits = payload.get('commits', [])
-            if commits:
-                print("  Commits:")
-                for commit in commits[-3:]:  # Tampilkan maksimal 3 commit terakhir
-                    message = commit.get('message', '').split('\n')[0]
-                    sha = commit.get('sha', '')[:7]
-                    print(f"    • {sha}: {message[:50]}{'...' if len(message) > 50 else ''}")
-        
-        elif event_type == 'IssuesEvent':
-            issue = payload.get('issue', {})
-            if issue:
-                title = issue.get('title', '')
-                print(f"  Issue: \"{title[:60]}{'...' if len(title) > 60 else ''}\"")
+        for line in self.additional_info_lines(activity):
+            print(line)
+    
+    def additional_info_lines(self, activity: Dict[str, Any]) -> List[str]:
+        """
+        Menghasilkan baris informasi tambahan untuk aktivitas tertentu
         
-        elif event_type == 'PullRequestEvent':
-            pr = payload.get('pull_request', {})
-            if pr:
-                title = pr.get('title', '')
-                print(f"  PR: \"{title[:60]}{'...' if len(title) > 60 else ''}\"")
+        Args:
+            activity: Data aktivitas dari GitHub API
+            
+        Returns:
+            List[str]: Baris-baris informasi tambahan (bisa kosong)
+        """
+        details = self.ADDITIONAL_INFO.get(activity.get('type', ''))
+        if details is None:
+            return []
+        return details(activity.get('payload') or {})
     
     def get_statistics(self):
         """
@@ -218,27 +342,171 @@ class GitHubActivityCLI:
         if not self.activities:
             return
         
-        event_counts = {}
-        repo_counts = {}
+        print_statistics(ActivityStatistics().update(self.activities))
+    
+    def activity_record(self, activity: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mengubah aktivitas menjadi record datar untuk output JSON/CSV
         
-        for activity in self.activities:
-            event_type = activity.get('type', 'Unknown')
-            repo_name = activity.get('repo', {}).get('name', 'Unknown')
+        Args:
+            activity: Data aktivitas dari GitHub API
             
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-            repo_counts[repo_name] = repo_counts.get(repo_name, 0) + 1
+        Returns:
+            Dict: Record aktivitas
+        """
+        return {
+            'user': self.username,
+            'id': activity.get('id'),
+            'type': activity.get('type', 'UnknownEvent'),
+            'repo': (activity.get('repo') or {}).get('name'),
+            'created_at': activity.get('created_at'),
+            'message': self.format_message(activity),
+            'details': [line.strip() for line in self.additional_info_lines(activity)],
+        }
+    
+    def get_report(self, max_activities: Optional[int] = None, include_stats: bool = False,
+                   top_n: int = 5) -> Dict[str, Any]:
+        """
+        Membuat laporan aktivitas dalam bentuk struktur data
         
-        print("\nActivity Statistics:")
-        print("-" * 30)
+        Args:
+            max_activities: Jumlah maksimal aktivitas (None berarti semua)
+            include_stats: Sertakan statistik aktivitas
+            top_n: Jumlah entri teratas pada statistik
+            
+        Returns:
+            Dict: Laporan dengan key 'user', 'total', 'activities', dan opsional 'statistics'
+        """
+        report = {
+            'user': self.username,
+            'total': len(self.activities),
+            'activities': [self.activity_record(a) for a in self.activities[:max_activities]],
+        }
+        if include_stats:
+            report['statistics'] = ActivityStatistics().update(self.activities).to_dict(top_n)
+        return report
+
+
+def fetch_reports(usernames: List[str], max_activities: Optional[int] = None,
+                  include_stats: bool = False, workers: int = 8,
+                  api_base: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Mengambil laporan aktivitas untuk banyak user sekaligus
+    
+    Request dijalankan paralel di thread pool karena sebagian besar waktunya
+    dihabiskan menunggu jaringan. Urutan laporan mengikuti urutan usernames.
+    
+    Args:
+        usernames: Daftar GitHub username
+        max_activities: Jumlah maksimal aktivitas per user (None berarti semua)
+        include_stats: Sertakan statistik aktivitas
+        workers: Jumlah thread maksimal
+        api_base: Base URL API (default: GITHUB_API_URL atau api.github.com)
         
-        print("Events by type:")
-        for event_type, count in sorted(event_counts.items(), key=lambda x: x[1], reverse=True):
-            event_name = event_type.replace('Event', '')
-            print(f"  {event_name}: {count}")
+    Returns:
+        List[Dict]: Laporan per user; user yang gagal memiliki key 'error'
+    """
+    def fetch_one(username: str) -> Dict[str, Any]:
+        cli = GitHubActivityCLI(username, api_base)
+        try:
+            cli.load_activities()
+        except GitHubActivityError as e:
+            return {'user': username, 'error': str(e)}
+        except Exception as e:
+            return {'user': username, 'error': f"Unexpected error - {e}"}
+        return cli.get_report(max_activities, include_stats)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(usernames)))) as executor:
+        return list(executor.map(fetch_one, usernames))
+
+
+def open_output_stream() -> TextIO:
+    """
+    Membuka stdout sebagai satu stream dengan buffer besar
+    
+    Returns:
+        TextIO: Stream yang harus di-close (flush) setelah selesai menulis
+    """
+    sys.stdout.flush()
+    return io.open(sys.stdout.fileno(), 'w', buffering=1 << 16, encoding='utf-8',
+                   newline='', closefd=False)
+
+
+def write_reports(reports: List[Dict[str, Any]], output_format: str, stream: TextIO):
+    """
+    Menulis laporan dalam format yang bisa dibaca mesin
+    
+    Args:
+        reports: Laporan dari get_report atau fetch_reports
+        output_format: 'json', 'jsonl', atau 'csv'
+        stream: Stream tujuan
+    """
+    if output_format == 'json':
+        json.dump(reports, stream, ensure_ascii=False)
+        stream.write('\n')
+    
+    elif output_format == 'jsonl':
+        # Satu baris per aktivitas, lalu satu baris per statistik/error user
+        for report in reports:
+            for record in report.get('activities', []):
+                stream.write(json.dumps(record, ensure_ascii=False))
+                stream.write('\n')
+            extra = {key: report[key] for key in ('statistics', 'error') if key in report}
+            if extra:
+                stream.write(json.dumps({'user': report['user'], **extra}, ensure_ascii=False))
+                stream.write('\n')
+    
+    elif output_format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for report in reports:
+            writer.writerows(report.get('activities', []))
+    
+    else:
+        raise ValueError(f"Unsupported output format '{output_format}'")
+
+
+def print_statistics(stats: ActivityStatistics, top_n: int = 5):
+    """
+    Menampilkan statistik aktivitas yang sudah dihitung
+    
+    Args:
+        stats: Statistik hasil ActivityStatistics
+        top_n: Jumlah repository dan hari teratas yang ditampilkan
+    """
+    print("\nActivity Statistics:")
+    print("-" * 30)
+    
+    print("Events by type:")
+    for event_type, count in stats.top_event_types():
+        event_name = event_type.replace('Event', '')
+        print(f"  {event_name}: {count}")
+    
+    if stats.commits:
+        print(f"\nCommits pushed: {stats.commits}")
+    
+    print("\nTop repositories:")
+    for repo, count in stats.top_repositories(top_n):
+        breakdown = ', '.join(
+            f"{event_type.replace('Event', '')} {n}"
+            for event_type, n in top_k(stats.repo_events[repo], 3)
+        )
+        print(f"  {repo}: {count} events ({breakdown})")
+    
+    if stats.daily:
+        print("\nMost active days:")
+        for day, count in stats.top_days(top_n):
+            print(f"  {day}: {count} events")
+        
+        peak = max(stats.hourly) or 1
+        print("\nActivity by hour (UTC):")
+        for hour, count in enumerate(stats.hourly):
+            if count:
+                print(f"  {hour:02d}:00 {'#' * max(1, round(count / peak * 30))} {count}")
         
-        print("\nTop repositories:")
-        for repo, count in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
-            print(f"  {repo}: {count} events")
+        longest, current = stats.streaks()
+        print(f"\nLongest streak: {longest} day{'s' if longest != 1 else ''}")
+        print(f"Current streak: {current} day{'s' if current != 1 else ''}")
 
 
 def show_help():
@@ -247,18 +515,21 @@ def show_help():
     """
     print("GitHub Activity CLI")
     print("=" * 60)
-    print("Usage: python github_activity.py <username> [options]")
+    print("Usage: python github_activity.py <username> [<username> ...] [options]")
     print("\nOptions:")
-    print("  <username>    GitHub username to fetch activities for")
-    print("  --help, -h    Show this help message")
-    print("  --stats, -s   Show activity statistics")
-    print("  --all, -a     Show all activities (default: 10)")
-    print("  --limit N     Show N activities (default: 10)")
+    print("  <username>      GitHub username(s) to fetch activities for")
+    print("  --help, -h      Show this help message")
+    print("  --stats, -s     Show activity statistics")
+    print("  --all, -a       Show all activities (default: 10)")
+    print("  --limit N       Show N activities (default: 10)")
+    print("  --format F      Output format: text, json, jsonl, csv (default: text)")
+    print("                  Machine formats include all activities unless --limit is given")
     print("\nExamples:")
     print("  python github_activity.py kamranahmedse")
     print("  python github_activity.py kamranahmedse --stats")
     print("  python github_activity.py kamranahmedse --limit 5")
     print("  python github_activity.py kamranahmedse --all")
+    print("  python github_activity.py kamranahmedse Suga-x --format jsonl --stats")
 
 
 def main():
@@ -270,40 +541,69 @@ def main():
         show_help()
         return
     
-    username = sys.argv[1]
     show_stats = '--stats' in sys.argv or '-s' in sys.argv
     show_all = '--all' in sys.argv or '-a' in sys.argv
     
-    # Cek limit parameter
+    # Cek parameter yang membutuhkan nilai, sisanya adalah username
     limit = None
-    for i, arg in enumerate(sys.argv):
-        if arg == '--limit' and i + 1 < len(sys.argv):
+    output_format = 'text'
+    usernames = []
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == '--limit':
             try:
-                limit = int(sys.argv[i + 1])
+                limit = int(next(args, ''))
             except ValueError:
                 print("Error: --limit must be followed by a number")
                 return
+        elif arg == '--format':
+            output_format = next(args, '')
+            if output_format not in OUTPUT_FORMATS:
+                print(f"Error: --format must be one of: {', '.join(OUTPUT_FORMATS)}")
+                return
+        elif not arg.startswith('-'):
+            usernames.append(arg)
     
-    # Inisialisasi dan jalankan CLI
-    cli = GitHubActivityCLI(username)
-    
-    # Fetch data dari GitHub API
-    if not cli.fetch_activities():
-        print("\nFailed to fetch activities. Please check the username and try again.")
+    if not usernames:
+        show_help()
         return
     
-    # Tampilkan aktivitas
-    if show_all:
-        cli.display_activities(max_activities=len(cli.activities))
-    elif limit is not None:
-        cli.display_activities(max_activities=limit)
-    else:
-        cli.display_activities()
+    # Output untuk pipeline: tanpa pesan progres, ditulis lewat satu stream
+    if output_format != 'text':
+        reports = fetch_reports(usernames, None if show_all else limit, show_stats)
+        stream = open_output_stream()
+        try:
+            write_reports(reports, output_format, stream)
+        finally:
+            stream.close()
+        for report in reports:
+            if 'error' in report:
+                print(f"Error ({report['user']}): {report['error']}", file=sys.stderr)
+        if any('error' in report for report in reports):
+            sys.exit(1)
+        return
     
-    # Tampilkan statistik jika diminta
-    if show_stats:
-        cli.get_statistics()
+    for username in usernames:
+        # Inisialisasi dan jalankan CLI
+        cli = GitHubActivityCLI(username)
+        
+        # Fetch data dari GitHub API
+        if not cli.fetch_activities():
+            print("\nFailed to fetch activities. Please check the username and try again.")
+            continue
+        
+        # Tampilkan aktivitas
+        if show_all:
+            cli.display_activities(max_activities=len(cli.activities))
+        elif limit is not None:
+            cli.display_activities(max_activities=limit)
+        else:
+            cli.display_activities()
+        
+        # Tampilkan statistik jika diminta
+        if show_stats:
+            cli.get_statistics()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
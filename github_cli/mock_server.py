@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Mock GitHub API Server
+Local stand-in for the GitHub Events API, for offline testing and benchmarks
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+SYNTHETIC_EVENT_TYPES = [
+    ('PushEvent', 50), ('WatchEvent', 15), ('CreateEvent', 10), ('IssuesEvent', 8),
+    ('PullRequestEvent', 8), ('IssueCommentEvent', 5), ('ForkEvent', 2), ('DeleteEvent', 2),
+]
+
+
+def generate_events(username: str, count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Membuat event sintetis dengan skema GitHub Events API
+
+    Args:
+        username: Login actor untuk semua event
+        count: Jumlah event
+        seed: Seed random agar hasil bisa direproduksi
+
+    Returns:
+        List[Dict]: Event terurut dari yang terbaru
+    """
+    rng = random.Random(f"{username}:{seed}")
+    types, weights = zip(*SYNTHETIC_EVENT_TYPES)
+    repos = [f"{username}/project-{i}" for i in range(8)] + ['octo/hello-world', 'python/cpython']
+    now = datetime(2024, 1, 31, tzinfo=timezone.utc)
+
+    events = []
+    for i in range(count):
+        event_type = rng.choices(types, weights)[0]
+        now -= timedelta(minutes=rng.randint(1, 600))
+        payload: Dict[str, Any] = {}
+        if event_type == 'PushEvent':
+            commits = [
+                {'sha': f"{rng.getrandbits(160):040x}", 'message': f"Commit {i}.{n}\n\nDetails"}
+                for n in range(rng.randint(1, 5))
+            ]
+            payload = {'size': len(commits), 'commits': commits}
+        elif event_type in ('IssuesEvent', 'PullRequestEvent'):
+            key = 'issue' if event_type == 'IssuesEvent' else 'pull_request'
+            payload = {'action': rng.choice(['opened', 'closed', 'reopened']),
+                       key: {'title': f"Synthetic {key.replace('_', ' ')} #{i}"}}
+        elif event_type in ('CreateEvent', 'DeleteEvent'):
+            payload = {'ref_type': rng.choice(['branch', 'tag']), 'ref': f"feature-{i}"}
+        events.append({
+            'id': str(10 ** 10 + i),
+            'type': event_type,
+            'actor': {'login': username},
+            'repo': {'name': rng.choice(repos)},
+            'payload': payload,
+            'public': True,
+            'created_at': now.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        })
+    return events
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Backlog default (5) membuat koneksi tertolak saat concurrency tinggi
+    request_queue_size = 128
+
+
+class MockGitHubServer:
+    """
+    Server HTTP lokal yang meniru endpoint /users/<username>/events
+
+    Mendukung pagination (page/per_page + header Link), ETag dan
+    If-None-Match (304), header rate limit, serta latency dan error buatan.
+    """
+
+    def __init__(self, events: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 host: str = '127.0.0.1', port: int = 0, per_page: int = 30,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit: Optional[int] = None, synthetic: int = 0):
+        """
+        Args:
+            events: Event yang direkam per username
+            host: Alamat bind
+            port: Port (0 berarti pilih port bebas)
+            per_page: Ukuran halaman default
+            latency: Latency tambahan per request dalam detik
+            jitter: Variasi random latency dalam detik
+            error_rate: Peluang (0-1) sebuah request dijawab 502
+            rate_limit: Jumlah request sebelum dijawab 403 (None berarti tanpa batas)
+            synthetic: Jika > 0, username yang tidak dikenal mendapat event sintetis sebanyak ini
+        """
+        self.events = dict(events or {})
+        self.per_page = per_page
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.synthetic = synthetic
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._pages: Dict[tuple, tuple] = {}
+        self._thread: Optional[threading.Thread] = None
+
+        self.httpd = _HTTPServer((host, port), self._make_handler())
+
+    @property
+    def url(self) -> str:
+        """Base URL server, bisa dipakai sebagai api_base"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page(self, username: str, page: int, per_page: int) -> Optional[tuple]:
+        """
+        Mengambil body, ETag, dan jumlah halaman untuk satu halaman event
+
+        Halaman yang sudah di-serialize disimpan, sehingga biaya server
+        tidak ikut terukur di benchmark. Dipanggil dari banyak thread
+        handler, jadi cache dan event sintetis dijaga dengan lock.
+
+        Returns:
+            tuple: (body, etag, last_page) atau None jika user tidak dikenal
+        """
+        key = (username, page, per_page)
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached is not None:
+                return cached
+
+            events = self.events.get(username)
+            if events is None:
+                if not self.synthetic:
+                    return None
+                events = self.events[username] = generate_events(username, self.synthetic)
+
+            last_page = max(1, -(-len(events) // per_page))
+            chunk = events[(page - 1) * per_page:page * per_page]
+            body = json.dumps(chunk).encode('utf-8')
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            self._pages[key] = (body, etag, last_page)
+            return self._pages[key]
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_body(self, status: int, body: bytes, headers: Dict[str, str]):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                    used = server.requests
+
+                delay = server.latency + (random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                headers = {'Content-Type': 'application/json; charset=utf-8'}
+                if server.rate_limit is not None:
+                    headers['X-RateLimit-Limit'] = str(server.rate_limit)
+                    headers['X-RateLimit-Remaining'] = str(max(0, server.rate_limit - used))
+                    headers['X-RateLimit-Reset'] = str(int(time.time()) + 3600)
+                    if used > server.rate_limit:
+                        message = b'{"message": "API rate limit exceeded"}'
+                        return self.send_body(403, message, headers)
+
+                if server.error_rate and random.random() < server.error_rate:
+                    return self.send_body(502, b'{"message": "Server Error"}', headers)
+
+                url = urlparse(self.path)
+                parts = url.path.strip('/').split('/')
+                if len(parts) != 3 or parts[0] != 'users' or parts[2] != 'events':
+                    return self.send_body(404, b'{"message": "Not Found"}', headers)
+
+                query = parse_qs(url.query)
+                try:
+                    page = max(1, int(query.get('page', ['1'])[0]))
+                    per_page = min(100, max(1, int(query.get('per_page', [str(server.per_page)])[0])))
+                except ValueError:
+                    return self.send_body(422, b'{"message": "Validation Failed"}', headers)
+
+                result = server.page(parts[1], page, per_page)
+                if result is None:
+                    return self.send_body(404, b'{"message": "Not Found"}', headers)
+                body, etag, last_page = result
+
+                headers['ETag'] = etag
+                base = f"{server.url}{url.path}?per_page={per_page}&page="
+                links = []
+                if page < last_page:
+                    links.append(f'<{base}{page + 1}>; rel="next"')
+                links.append(f'<{base}{last_page}>; rel="last"')
+                headers['Link'] = ', '.join(links)
+
+                if self.headers.get('If-None-Match') == etag:
+                    return self.send_body(304, b'', headers)
+                self.send_body(200, body, headers)
+
+        return Handler
+
+    def start(self) -> 'MockGitHubServer':
+        """Menjalankan server di background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Menghentikan server"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockGitHubServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def load_recordings(directory: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Memuat event yang direkam dari direktori berisi file <username>.json
+
+    Args:
+        directory: Direktori rekaman
+
+    Returns:
+        Dict: Mapping username -> daftar event
+    """
+    recordings = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.json'):
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                recordings[name[:-len('.json')]] = json.load(f)
+    return recordings
+
+
+def main():
+    """
+    Fungsi utama untuk menjalankan mock server
+    """
+    parser = argparse.ArgumentParser(description="Local mock of the GitHub Events API")
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port (default: 8080)')
+    parser.add_argument('--recordings', help='Directory of recorded <username>.json event lists')
+    parser.add_argument('--synthetic', type=int, default=90,
+                        help='Synthetic events for unknown users, 0 to return 404 (default: 90)')
+    parser.add_argument('--per-page', type=int, default=30, help='Default page size (default: 30)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Added latency per request in ms')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random extra latency in ms')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered 502')
+    parser.add_argument('--rate-limit', type=int, help='Requests allowed before answering 403')
+    args = parser.parse_args()
+
+    try:
+        recordings = load_recordings(args.recordings) if args.recordings else {}
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error: Could not load recordings - {e}")
+        sys.exit(1)
+
+    server = MockGitHubServer(
+        recordings, args.host, args.port, args.per_page, args.latency / 1000,
+        args.jitter / 1000, args.error_rate, args.rate_limit, args.synthetic,
+    )
+    print(f"Mock GitHub API listening on {server.url}")
+    print(f"Use it with: GITHUB_API_URL={server.url} python github_activity.py <username>")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
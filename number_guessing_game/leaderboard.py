@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import tempfile
+from bisect import bisect_left, insort
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, so concurrent writers are not serialized there
+    fcntl = None
+
+LEADERBOARD_FILE = 'leaderboard.json'
+
+def _key(entry):
+    """Sort key: fewest attempts first, then fastest time, then player name"""
+    return (entry['attempts'], entry['time_taken'], entry['player'])
+
+class _Board:
+    """
+    Best result per player for one difficulty, kept sorted.
+
+    keys is a sorted list searched with bisect, so rank and top-N lookups are
+    O(log N); inserting shifts the list, which is a fast memmove at any
+    realistic leaderboard size.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.entries = {}
+
+    def submit(self, entry):
+        """Record an entry if it beats the player's best; returns True if it did"""
+        key = _key(entry)
+        old = self.entries.get(entry['player'])
+        if old is not None:
+            old_key = _key(old)
+            if old_key <= key:
+                return False
+            del self.keys[bisect_left(self.keys, old_key)]
+        insort(self.keys, key)
+        self.entries[entry['player']] = entry
+        return True
+
+    def rank(self, player):
+        entry = self.entries.get(player)
+        if entry is None:
+            return None
+        return bisect_left(self.keys, _key(entry)) + 1
+
+    def top(self, n):
+        return [self.entries[key[2]] for key in self.keys[:n]]
+
+class Leaderboard:
+    """
+    Persistent leaderboard keyed by player and difficulty.
+
+    Updates take an exclusive lock on a side file, re-read the current board,
+    apply the score and atomically replace the JSON file, so many game
+    sessions can submit at once without losing each other's results.
+    """
+
+    def __init__(self, data_file=LEADERBOARD_FILE):
+        self.data_file = data_file
+        self.lock_file = data_file + '.lock'
+        self.boards = {}
+        self._loaded_stamp = None
+        self.refresh()
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def refresh(self):
+        """Reload the board if another session has changed the file since the last load"""
+        stamp = self._stamp()
+        if stamp == self._loaded_stamp:
+            return
+        boards = {}
+        if stamp is not None:
+            try:
+                with open(self.data_file, 'r') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Could not read leaderboard: {e}")
+                data = {}
+            for difficulty, entries in data.items():
+                board = boards[difficulty] = _Board()
+                for entry in entries:
+                    board.submit(entry)
+        self.boards = boards
+        self._loaded_stamp = stamp
+
+    @contextmanager
+    def _locked(self):
+        with open(self.lock_file, 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _save(self):
+        data = {difficulty: board.top(len(board.keys)) for difficulty, board in self.boards.items()}
+        directory = os.path.dirname(os.path.abspath(self.data_file))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.leaderboard-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.data_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._loaded_stamp = self._stamp()
+
+    def submit(self, player, difficulty, attempts, time_taken):
+        """
+        Record a winning round.
+
+        Returns (improved, rank): whether it beat the player's previous best
+        for this difficulty, and the player's rank afterwards.
+        """
+        return self.submit_many([(player, difficulty, attempts, time_taken)])[0]
+
+    def submit_many(self, scores):
+        """Record several (player, difficulty, attempts, time_taken) wins with one locked write"""
+        date = datetime.now().isoformat(timespec='seconds')
+        with self._locked():
+            self.refresh()
+            outcomes = []
+            for player, difficulty, attempts, time_taken in scores:
+                entry = {'player': player, 'attempts': attempts, 'time_taken': round(time_taken, 3), 'date': date}
+                outcomes.append((difficulty, player, self.boards.setdefault(difficulty, _Board()).submit(entry)))
+            if any(improved for _, _, improved in outcomes):
+                self._save()
+        return [(improved, self.boards[difficulty].rank(player)) for difficulty, player, improved in outcomes]
+
+    def top(self, difficulty, n=10):
+        self.refresh()
+        board = self.boards.get(difficulty)
+        return board.top(n) if board is not None else []
+
+    def rank(self, player, difficulty):
+        """1-based rank of the player's best result, or None if they have none"""
+        self.refresh()
+        board = self.boards.get(difficulty)
+        return board.rank(player) if board is not None else None
+
+    def best(self, player, difficulty):
+        self.refresh()
+        board = self.boards.get(difficulty)
+        return board.entries.get(player) if board is not None else None
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the Number Guessing Game leaderboard")
+    parser.add_argument('--file', default=LEADERBOARD_FILE, help=f'Leaderboard file (default: {LEADERBOARD_FILE})')
+    parser.add_argument('--difficulty', help='Only show this difficulty (e.g. Medium)')
+    parser.add_argument('--top', type=int, default=10, help='Number of entries to show (default: 10)')
+    parser.add_argument('--player', help='Also show this player\'s rank')
+    args = parser.parse_args()
+
+    leaderboard = Leaderboard(args.file)
+    difficulties = [args.difficulty] if args.difficulty else list(leaderboard.boards)
+    if not difficulties:
+        print("No scores yet")
+    for difficulty in difficulties:
+        print(f"\n{difficulty}")
+        for position, entry in enumerate(leaderboard.top(difficulty, args.top), 1):
+            print(f"{position:>4}. {entry['player']:<20} {entry['attempts']:>3} attempts  {entry['time_taken']:>8.2f}s")
+        if args.player:
+            rank = leaderboard.rank(args.player, difficulty)
+            print(f"  {args.player}: {'#' + str(rank) if rank else 'no score yet'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import asyncio
+import random
+import time
+
+from simulation import BinarySearchStrategy
+
+async def command(reader, writer, line):
+    writer.write(line.encode() + b"\n")
+    await writer.drain()
+    return (await reader.readline()).decode().strip()
+
+async def play_session(host, port, player, difficulty, rounds, rng, latencies):
+    """One connection playing `rounds` rounds with binary search; returns the number of wins"""
+    reader, writer = await asyncio.open_connection(host, port)
+    strategy = BinarySearchStrategy(rng)
+    wins = 0
+    try:
+        await reader.readline()
+        await command(reader, writer, f"NAME {player}")
+        for _ in range(rounds):
+            await command(reader, writer, f"START {difficulty}")
+            strategy.start()
+            while True:
+                guess = strategy.next_guess()
+                started = time.perf_counter()
+                reply = await command(reader, writer, f"GUESS {guess}")
+                latencies.append(time.perf_counter() - started)
+                kind = reply.split(' ', 1)[0]
+                if kind == 'WIN':
+                    wins += 1
+                    break
+                if kind in ('LOSE', 'ERR', ''):
+                    break
+                strategy.observe(guess, kind.lower(), None)
+        await command(reader, writer, "QUIT")
+    finally:
+        writer.close()
+    return wins
+
+async def server_stats(host, port):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await reader.readline()
+        reply = await command(reader, writer, "STATS")
+        await command(reader, writer, "QUIT")
+    finally:
+        writer.close()
+    return dict(field.split('=', 1) for field in reply.split()[1:])
+
+async def measure_memory(host, port, sessions):
+    """
+    Hold many idle sessions open (each with a round started) and report server
+    RSS growth per session in bytes, or None if the server cannot measure RSS
+    """
+    before = (await server_stats(host, port))['rss_kb']
+    if not before.isdigit():
+        return None
+    connections = []
+    try:
+        for i in range(sessions):
+            reader, writer = await asyncio.open_connection(host, port)
+            connections.append(writer)
+            await reader.readline()
+            await command(reader, writer, f"NAME idle-{i}")
+            await command(reader, writer, "START medium")
+        after = (await server_stats(host, port))['rss_kb']
+    finally:
+        for writer in connections:
+            writer.close()
+    return (int(after) - int(before)) * 1024 / sessions
+
+def percentile(samples, pct):
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+async def run(args):
+    rng = random.Random(args.seed)
+    latencies = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited(i):
+        async with semaphore:
+            return await play_session(args.host, args.port, f"bot-{i}", args.difficulty,
+                                      args.rounds, random.Random(rng.random()), latencies)
+
+    started = time.perf_counter()
+    wins = sum(await asyncio.gather(*(limited(i) for i in range(args.sessions))))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    rounds = args.sessions * args.rounds
+    print(f"Sessions: {args.sessions} ({args.concurrency} concurrent), {args.rounds} round(s) each, "
+          f"difficulty {args.difficulty}")
+    print(f"Elapsed: {elapsed:.2f}s")
+    print(f"Sessions/s: {args.sessions / elapsed:,.1f}")
+    print(f"Rounds/s: {rounds / elapsed:,.1f} (win rate {wins / rounds * 100:.1f}%)")
+    print(f"Guesses/s: {len(latencies) / elapsed:,.1f}, "
+          f"p50 {percentile(latencies, 50) * 1000:.2f} ms, p99 {percentile(latencies, 99) * 1000:.2f} ms")
+
+    if args.idle_sessions:
+        per_session = await measure_memory(args.host, args.port, args.idle_sessions)
+        if per_session is None:
+            print("Server memory per idle session: unavailable (server cannot measure its RSS)")
+        else:
+            print(f"Server memory per idle session: {per_session / 1024:.1f} KiB "
+                  f"(measured over {args.idle_sessions} sessions)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Number Guessing Game server")
+    parser.add_argument('--host', default='127.0.0.1', help='Server address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=7777, help='Server port (default: 7777)')
+    parser.add_argument('--sessions', type=int, default=2000, help='Sessions to play in total (default: 2000)')
+    parser.add_argument('--concurrency', type=int, default=500, help='Sessions connected at once (default: 500)')
+    parser.add_argument('--rounds', type=int, default=3, help='Rounds per session (default: 3)')
+    parser.add_argument('--difficulty', default='medium', help='Difficulty to play (default: medium)')
+    parser.add_argument('--idle-sessions', type=int, default=1000,
+                        help='Idle sessions to open for the memory measurement, 0 to skip (default: 1000)')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible runs')
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,64 @@
 import random
 import time
 
+from leaderboard import Leaderboard
+
+LOWEST, HIGHEST = 1, 100
+
+DIFFICULTY_SETTINGS = {
+    '1': {'name': 'Easy', 'chances': 10},
+    '2': {'name': 'Medium', 'chances': 5},
+    '3': {'name': 'Hard', 'chances': 3}
+}
+
+HINT_MESSAGES = {
+    'even': "! Hint: The number is even.",
+    'odd': "! Hint: The number is odd.",
+    'low': "! Hint: The number is less than 50.",
+    'high': "! Hint: The number is 50 or greater.",
+}
+
+def hint_for(number, attempt, max_attempts):
+    """Hint code ('even', 'odd', 'low', 'high') due after a wrong guess, or None"""
+    if attempt == max_attempts // 2:
+        return 'even' if number % 2 == 0 else 'odd'
+    if attempt >= max_attempts * 0.75:
+        return 'low' if number < 50 else 'high'
+    return None
+
+class GameRound:
+    """Game logic for a single round, without any input or output"""
+
+    __slots__ = ('number', 'max_attempts', 'attempts', 'won')
+
+    def __init__(self, number, max_attempts):
+        self.number = number
+        self.max_attempts = max_attempts
+        self.attempts = 0
+        self.won = False
+
+    @property
+    def finished(self):
+        return self.won or self.attempts >= self.max_attempts
+
+    def guess(self, value):
+        """Score a guess: 'correct', 'higher' (the number is greater) or 'lower'"""
+        if value < LOWEST or value > HIGHEST:
+            raise ValueError(f"Guess must be between {LOWEST} and {HIGHEST}")
+        self.attempts += 1
+        if value == self.number:
+            self.won = True
+            return 'correct'
+        return 'higher' if value < self.number else 'lower'
+
+    def hint(self):
+        return hint_for(self.number, self.attempts, self.max_attempts)
+
 class NumberGuessingGame:
-    def __init__(self):
-        self.high_scores = {'Easy': None, 'Medium': None, 'Hard': None}
-        self.difficulty_settings = {
-            '1': {'name': 'Easy', 'chances': 10},
-            '2': {'name': 'Medium', 'chances': 5},
-            '3': {'name': 'Hard', 'chances': 3}
-        }
+    def __init__(self, leaderboard=None):
+        self.leaderboard = leaderboard if leaderboard is not None else Leaderboard()
+        self.player = 'Player'
+        self.difficulty_settings = {key: dict(level) for key, level in DIFFICULTY_SETTINGS.items()}
         
     def display_welcome(self):
         print("\n" + "="*50)
@@ -24,6 +74,12 @@ class NumberGuessingGame:
         print("4. Try to guess in as few attempts as possible!")
         print("-"*50)
         
+    def get_player_name(self):
+        name = input("\nEnter your name for the leaderboard: ").strip()
+        if name:
+            self.player = name
+        return self.player
+
     def get_difficulty(self):
         print("\nPlease select the difficulty level:")
         print("1. Easy (10 chances)")
@@ -42,83 +98,85 @@ class NumberGuessingGame:
     
     def provide_hint(self, number, attempt, max_attempts):
         """Provide hints based on the user's progress"""
-        if attempt == max_attempts // 2:
-            if number % 2 == 0:
-                print("! Hint: The number is even.")
-            else:
-                print("! Hint: The number is odd.")
-        elif attempt >= max_attempts * 0.75:
-            if number < 50:
-                print("! Hint: The number is less than 50.")
-            else:
-                print("! Hint: The number is 50 or greater.")
+        hint = hint_for(number, attempt, max_attempts)
+        if hint:
+            print(HINT_MESSAGES[hint])
     
     def play_round(self, difficulty):
-        number = random.randint(1, 100)
-        max_attempts = difficulty['chances']
-        attempts = 0
+        game = GameRound(random.randint(LOWEST, HIGHEST), difficulty['chances'])
         start_time = time.time()
         
         print("\n" + "="*50)
         print("Let's start the game!")
         print("="*50)
         
-        while attempts < max_attempts:
-            attempts_left = max_attempts - attempts
+        while not game.finished:
+            attempts_left = game.max_attempts - game.attempts
             print(f"\nYou have {attempts_left} chance{'s' if attempts_left > 1 else ''} left.")
             
             try:
                 guess = int(input("Enter your guess (1-100): "))
                 
-                if guess < 1 or guess > 100:
+                if guess < LOWEST or guess > HIGHEST:
                     print("Please enter a number between 1 and 100.")
                     continue
                     
-                attempts += 1
+                result = game.guess(guess)
+                attempts = game.attempts
                 
-                if guess == number:
+                if result == 'correct':
                     end_time = time.time()
                     time_taken = end_time - start_time
                     print(f"\n🎉 Congratulations! You guessed the correct number in {attempts} attempt{'s' if attempts > 1 else ''}!")
                     print(f"⏱️ Time taken: {time_taken:.2f} seconds")
                     
                     # Update high score
-                    self.update_high_score(difficulty['name'], attempts)
+                    self.update_high_score(difficulty['name'], attempts, time_taken)
                     return True, attempts, time_taken
                     
-                elif guess < number:
+                elif result == 'higher':
                     print(f"Incorrect! The number is greater than {guess}.")
                 else:
                     print(f"Incorrect! The number is less than {guess}.")
                 
                 # Provide hints
-                self.provide_hint(number, attempts, max_attempts)
+                self.provide_hint(game.number, attempts, game.max_attempts)
                 
             except ValueError:
                 print("Please enter a valid number!")
         
         print(f"\n💀 Game Over! You've run out of chances.")
-        print(f"The number was: {number}")
-        return False, attempts, time.time() - start_time
+        print(f"The number was: {game.number}")
+        return False, game.attempts, time.time() - start_time
     
-    def update_high_score(self, difficulty_name, attempts):
-        if self.high_scores[difficulty_name] is None or attempts < self.high_scores[difficulty_name]:
-            self.high_scores[difficulty_name] = attempts
-            print(f"🏆 New high score for {difficulty_name} difficulty: {attempts} attempts!")
+    def update_high_score(self, difficulty_name, attempts, time_taken):
+        improved, rank = self.leaderboard.submit(self.player, difficulty_name, attempts, time_taken)
+        if improved:
+            print(f"🏆 New high score for {difficulty_name} difficulty: {attempts} attempts! "
+                  f"You are #{rank} on the leaderboard.")
     
-    def display_high_scores(self):
+    def display_high_scores(self, top_n=3):
         print("\n" + "="*50)
         print("HIGH SCORES")
         print("="*50)
-        for difficulty, score in self.high_scores.items():
-            if score:
-                print(f"{difficulty}: {score} attempts")
-            else:
+        for level in self.difficulty_settings.values():
+            difficulty = level['name']
+            scores = self.leaderboard.top(difficulty, top_n)
+            if not scores:
                 print(f"{difficulty}: No score yet")
+                continue
+            print(f"{difficulty}:")
+            for position, score in enumerate(scores, 1):
+                print(f"  {position}. {score['player']}: {score['attempts']} attempts in {score['time_taken']:.2f}s")
+            rank = self.leaderboard.rank(self.player, difficulty)
+            if rank is not None and rank > top_n:
+                best = self.leaderboard.best(self.player, difficulty)
+                print(f"  #{rank}. {self.player}: {best['attempts']} attempts in {best['time_taken']:.2f}s")
     
     def play_game(self):
         self.display_welcome()
         self.display_rules()
+        self.get_player_name()
         
         total_rounds = 0
         total_wins = 0
@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from leaderboard import LEADERBOARD_FILE, Leaderboard
+from number_guessing_game import DIFFICULTY_SETTINGS, HIGHEST, LOWEST, GameRound
+
+MAX_LINE = 1024
+
+# Accept "2", "medium" or "Medium"
+DIFFICULTIES = {}
+for key, level in DIFFICULTY_SETTINGS.items():
+    DIFFICULTIES[key] = level
+    DIFFICULTIES[level['name'].lower()] = level
+
+HELP = ("COMMANDS NAME <player> | START <easy|medium|hard> | GUESS <n> | "
+        "SCORES <difficulty> [n] | STATS | QUIT")
+
+def rss_kb():
+    """Current resident memory of this process in KiB, or None if it cannot be measured"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError):
+        # Peak rather than current RSS, but the best available off Linux
+        try:
+            import resource
+        except ImportError:
+            return None
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KiB on Linux and the BSDs
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+class Session:
+    """Per-connection state, kept small so thousands of idle players stay cheap"""
+
+    __slots__ = ('player', 'difficulty', 'game', 'started')
+
+    def __init__(self):
+        self.player = 'Player'
+        self.difficulty = None
+        self.game = None
+        self.started = 0.0
+
+class GameServer:
+    """
+    Line-protocol game server: one asyncio task per connection.
+
+    Every command is one line and gets one reply line (SCORES replies with
+    several lines ending in END). Connections idle for longer than
+    idle_timeout are closed. Leaderboard reads and writes run on a single
+    worker thread so file locking and fsync never block the event loop, and
+    wins arriving while a write is in flight are committed together in the
+    next one.
+    """
+
+    def __init__(self, leaderboard, idle_timeout=60.0, max_sessions=10000):
+        self.leaderboard = leaderboard
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.active = 0
+        self.total = 0
+        self.rounds = 0
+        self.wins = 0
+        self._board_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='leaderboard')
+        self._pending = []
+        self._flushing = None
+        self.commands = {
+            'NAME': self.cmd_name,
+            'START': self.cmd_start,
+            'GUESS': self.cmd_guess,
+            'SCORES': self.cmd_scores,
+            'STATS': self.cmd_stats,
+            'HELP': self.cmd_help,
+        }
+
+    async def _board(self, method, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._board_executor, method, *args)
+
+    async def _submit(self, *score):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((score, future))
+        if self._flushing is None:
+            self._flushing = asyncio.ensure_future(self._flush())
+        return await future
+
+    async def _flush(self):
+        """Group commit: write every pending win in one locked leaderboard update"""
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                try:
+                    outcomes = await self._board(self.leaderboard.submit_many, [score for score, _ in batch])
+                except Exception as e:
+                    for _, future in batch:
+                        future.set_exception(e)
+                    continue
+                for (_, future), outcome in zip(batch, outcomes):
+                    future.set_result(outcome)
+        finally:
+            self._flushing = None
+
+    async def handle(self, reader, writer):
+        if self.active >= self.max_sessions:
+            writer.write(b"ERR server full\n")
+            await writer.drain()
+            writer.close()
+            return
+
+        self.active += 1
+        self.total += 1
+        session = Session()
+        try:
+            writer.write(f"WELCOME guess a number between {LOWEST} and {HIGHEST}. {HELP}\n".encode())
+            await writer.drain()
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    writer.write(b"TIMEOUT\n")
+                    break
+                except ValueError:
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                command, _, argument = line.decode('utf-8', 'replace').strip().partition(' ')
+                command = command.upper()
+                if command == 'QUIT':
+                    writer.write(b"BYE\n")
+                    break
+                handler = self.commands.get(command)
+                reply = await handler(session, argument.strip()) if handler else f"ERR unknown command. {HELP}"
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.active -= 1
+            writer.close()
+
+    async def cmd_help(self, session, argument):
+        return HELP
+
+    async def cmd_name(self, session, argument):
+        if not argument or len(argument) > 32:
+            return "ERR name must be 1-32 characters"
+        session.player = argument
+        return f"OK player={argument}"
+
+    async def cmd_start(self, session, argument):
+        level = DIFFICULTIES.get(argument.lower())
+        if level is None:
+            return "ERR difficulty must be easy, medium or hard"
+        session.difficulty = level['name']
+        session.game = GameRound(random.randint(LOWEST, HIGHEST), level['chances'])
+        session.started = time.monotonic()
+        self.rounds += 1
+        return f"START chances={level['chances']}"
+
+    async def cmd_guess(self, session, argument):
+        game = session.game
+        if game is None:
+            return "ERR no round in progress, send START first"
+        try:
+            result = game.guess(int(argument))
+        except ValueError:
+            return f"ERR guess must be a number between {LOWEST} and {HIGHEST}"
+
+        if result == 'correct':
+            session.game = None
+            self.wins += 1
+            time_taken = time.monotonic() - session.started
+            improved, rank = await self._submit(session.player, session.difficulty, game.attempts, time_taken)
+            return (f"WIN attempts={game.attempts} time={time_taken:.2f} rank={rank} "
+                    f"best={'yes' if improved else 'no'}")
+        if game.finished:
+            session.game = None
+            return f"LOSE number={game.number}"
+
+        reply = f"{result.upper()} left={game.max_attempts - game.attempts}"
+        hint = game.hint()
+        return f"{reply} hint={hint}" if hint else reply
+
+    async def cmd_scores(self, session, argument):
+        difficulty, _, count = argument.partition(' ')
+        level = DIFFICULTIES.get(difficulty.lower()) if difficulty else None
+        if level is None:
+            return "ERR usage: SCORES <easy|medium|hard> [n]"
+        n = int(count) if count.strip().isdigit() else 10
+        top = await self._board(self.leaderboard.top, level['name'], min(n, 100))
+        lines = [f"SCORE rank={position} player={entry['player']} attempts={entry['attempts']} "
+                 f"time={entry['time_taken']:.2f}" for position, entry in enumerate(top, 1)]
+        return "\n".join(lines + ["END"])
+
+    async def cmd_stats(self, session, argument):
+        return (f"STATS active={self.active} total={self.total} rounds={self.rounds} "
+                f"wins={self.wins} rss_kb={rss_kb() or 'unavailable'}")
+
+    async def serve(self, host, port, backlog=1024):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE, backlog=backlog)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"Number Guessing Game server listening on {addresses}")
+        async with server:
+            await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Host the Number Guessing Game for many players over TCP")
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=7777, help='Port (default: 7777)')
+    parser.add_argument('--idle-timeout', type=float, default=60.0,
+                        help='Seconds before an idle connection is closed (default: 60)')
+    parser.add_argument('--max-sessions', type=int, default=10000,
+                        help='Maximum concurrent connections (default: 10000)')
+    parser.add_argument('--leaderboard', default=LEADERBOARD_FILE, help=f'Leaderboard file (default: {LEADERBOARD_FILE})')
+    args = parser.parse_args()
+
+    server = GameServer(Leaderboard(args.leaderboard), args.idle_timeout, args.max_sessions)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\nServer stopped after {server.total} sessions, {server.rounds} rounds, {server.wins} wins")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from number_guessing_game import DIFFICULTY_SETTINGS, HIGHEST, LOWEST, GameRound
+
+class BinarySearchStrategy:
+    """Always guesses the middle of the range still consistent with the feedback"""
+
+    name = 'binary'
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    def start(self):
+        self.low, self.high = LOWEST, HIGHEST
+
+    def next_guess(self):
+        return (self.low + self.high) // 2
+
+    def observe(self, guess, result, hint):
+        if result == 'higher':
+            self.low = guess + 1
+        else:
+            self.high = guess - 1
+
+class RandomStrategy(BinarySearchStrategy):
+    """Guesses uniformly at random within the range still consistent with the feedback"""
+
+    name = 'random'
+
+    def next_guess(self):
+        return self.rng.randint(self.low, self.high)
+
+class HintAwareStrategy(BinarySearchStrategy):
+    """Binary search that also narrows the candidates with the even/odd and 50 hints"""
+
+    name = 'hint'
+
+    def start(self):
+        super().start()
+        self.parity = None
+
+    def next_guess(self):
+        if self.parity is None:
+            return (self.low + self.high) // 2
+        # Middle of the candidates with the right parity
+        first = self.low if self.low % 2 == self.parity else self.low + 1
+        last = self.high if self.high % 2 == self.parity else self.high - 1
+        if last < first:
+            return self.low
+        return first + 2 * ((last - first) // 4)
+
+    def observe(self, guess, result, hint):
+        super().observe(guess, result, hint)
+        if hint == 'even' or hint == 'odd':
+            self.parity = 0 if hint == 'even' else 1
+        elif hint == 'low':
+            self.high = min(self.high, 49)
+        elif hint == 'high':
+            self.low = max(self.low, 50)
+
+STRATEGIES = {strategy.name: strategy for strategy in (BinarySearchStrategy, HintAwareStrategy, RandomStrategy)}
+
+def simulate(strategy_name, chances, rounds, seed=None):
+    """Play rounds headlessly; returns wins[attempts] counts (index 0 unused)"""
+    rng = random.Random(seed)
+    strategy = STRATEGIES[strategy_name](rng)
+    wins = [0] * (chances + 1)
+    for _ in range(rounds):
+        game = GameRound(rng.randint(LOWEST, HIGHEST), chances)
+        strategy.start()
+        while not game.finished:
+            guess = strategy.next_guess()
+            result = game.guess(guess)
+            if result != 'correct':
+                strategy.observe(guess, result, game.hint())
+        if game.won:
+            wins[game.attempts] += 1
+    return wins
+
+def _simulate_job(job):
+    return job, simulate(job[1], job[2], job[3], job[4])
+
+def run_simulations(levels, strategies, rounds, workers=None, seed=None, chunk_size=50000):
+    """
+    Simulate every (level, strategy) pair across a process pool.
+
+    levels maps a difficulty name to its number of chances. Rounds are split
+    into chunks so the work spreads evenly over the workers. Returns
+    {(level, strategy): wins} with the chunk results summed.
+    """
+    seeds = random.Random(seed)
+    jobs = []
+    for level, chances in levels.items():
+        for strategy_name in strategies:
+            remaining = rounds
+            while remaining > 0:
+                size = min(chunk_size, remaining)
+                jobs.append((level, strategy_name, chances, size, seeds.getrandbits(64)))
+                remaining -= size
+
+    results = {(level, strategy_name): [0] * (chances + 1)
+               for level, chances in levels.items() for strategy_name in strategies}
+
+    if len(jobs) <= 1 or workers == 1:
+        partials = map(_simulate_job, jobs)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        partials = executor.map(_simulate_job, jobs)
+
+    try:
+        for (level, strategy_name, *_), wins in partials:
+            totals = results[level, strategy_name]
+            for attempts, count in enumerate(wins):
+                totals[attempts] += count
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return results
+
+def summarize(wins, rounds):
+    """Win rate, mean attempts of winning rounds and the attempt distribution"""
+    won = sum(wins)
+    return {
+        'rounds': rounds,
+        'wins': won,
+        'win_rate': won / rounds if rounds else 0.0,
+        'mean_attempts': sum(attempts * count for attempts, count in enumerate(wins)) / won if won else None,
+        # Share of all rounds won on each attempt
+        'distribution': {attempts: count / rounds for attempts, count in enumerate(wins) if attempts and rounds},
+    }
+
+def print_report(results, levels, rounds):
+    print(f"{'Difficulty':<12} {'Chances':>7} {'Strategy':<8} {'Win rate':>9} {'Avg tries':>9}  Wins by attempt")
+    for (level, strategy_name), wins in results.items():
+        summary = summarize(wins, rounds)
+        mean = f"{summary['mean_attempts']:.2f}" if summary['mean_attempts'] is not None else "-"
+        distribution = " ".join(f"{attempts}:{share * 100:.1f}%"
+                                for attempts, share in summary['distribution'].items())
+        print(f"{level:<12} {levels[level]:>7} {strategy_name:<8} "
+              f"{summary['win_rate'] * 100:>8.1f}% {mean:>9}  {distribution}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate Number Guessing Game strategies headlessly")
+    parser.add_argument('--rounds', type=int, default=100000, help='Rounds per difficulty and strategy (default: 100000)')
+    parser.add_argument('--strategies', nargs='+', choices=list(STRATEGIES), default=list(STRATEGIES),
+                        help='Strategies to simulate (default: all)')
+    parser.add_argument('--chances', type=int, nargs='+', default=[],
+                        help='Extra custom levels to try, by number of chances (e.g. --chances 4 6 7)')
+    parser.add_argument('--workers', type=int, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible runs')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    levels = {level['name']: level['chances'] for level in DIFFICULTY_SETTINGS.values()}
+    for chances in args.chances:
+        levels.setdefault(f"Custom-{chances}", chances)
+
+    results = run_simulations(levels, args.strategies, args.rounds, args.workers or os.cpu_count(), args.seed)
+
+    if args.json:
+        print(json.dumps([
+            {'difficulty': level, 'chances': levels[level], 'strategy': strategy_name,
+             **summarize(wins, args.rounds)}
+            for (level, strategy_name), wins in results.items()
+        ], indent=2))
+    else:
+        print_report(results, levels, args.rounds)
+
+if __name__ == "__main__":
+    main()
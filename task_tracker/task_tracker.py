@@ -7,8 +7,14 @@ A simple command-line application to track tasks with JSON storage
 import json
 import os
 import sys
+import uuid
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+
+def change_rank(record: Dict[str, Any]) -> Tuple[int, str]:
+    """Order of competing versions of a task: higher version wins, ties go to the higher replica ID"""
+    return (record.get('version', 0), record.get('origin', ''))
 
 
 class TaskTracker:
@@ -17,6 +23,12 @@ class TaskTracker:
     def __init__(self, data_file: str = "tasks.json"):
         """Initialize the task tracker with data file"""
         self.data_file = data_file
+        # Replication state: this replica's ID, its change sequence number,
+        # tombstones of deleted tasks and the last sequence imported from each peer
+        self.replica = uuid.uuid4().hex[:12]
+        self.seq = 0
+        self.deleted: List[Dict[str, Any]] = []
+        self.peers: Dict[str, int] = {}
         self.tasks = self._load_tasks()
         self.next_id = self._get_next_id()
     
@@ -25,23 +37,55 @@ class TaskTracker:
         try:
             if os.path.exists(self.data_file):
                 with open(self.data_file, 'r') as f:
-                    return json.load(f)
+                    data = json.load(f)
             else:
-                # Create empty JSON file
-                with open(self.data_file, 'w') as f:
-                    json.dump([], f)
-                return []
+                data = []
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading tasks: {e}")
             return []
+
+        if isinstance(data, list):
+            # Plain task list from before replication: give every task sync metadata
+            tasks = data
+            for task in tasks:
+                self._touch(task)
+                task['uid'] = f"{task['id']}@{task.get('created_at', '')}"
+            self._save(tasks)
+            return tasks
+
+        self.replica = data['replica']
+        self.seq = data['seq']
+        self.deleted = data.get('deleted', [])
+        self.peers = data.get('peers', {})
+        return data['tasks']
     
     def _save_tasks(self) -> None:
         """Save tasks to JSON file"""
+        self._save(self.tasks)
+
+    def _save(self, tasks: List[Dict[str, Any]]) -> None:
+        """Write tasks and replication state atomically, so a crash never leaves a partial file"""
+        data = {
+            'replica': self.replica,
+            'seq': self.seq,
+            'peers': self.peers,
+            'tasks': tasks,
+            'deleted': self.deleted,
+        }
+        temp_file = f"{self.data_file}.tmp"
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.tasks, f, indent=2)
+            with open(temp_file, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_file, self.data_file)
         except IOError as e:
             print(f"Error saving tasks: {e}")
+
+    def _touch(self, task: Dict[str, Any]) -> None:
+        """Record a local change: bump the task's version and stamp it with the next sequence number"""
+        self.seq += 1
+        task['version'] = task.get('version', 0) + 1
+        task['seq'] = self.seq
+        task['origin'] = self.replica
     
     def _get_next_id(self) -> int:
         """Get the next available task ID"""
@@ -83,11 +127,15 @@ class TaskTracker:
         
         task = {
             'id': self.next_id,
+            # Random rather than derived from the replica, so tasks stay distinct
+            # even on hosts whose tasks.json was copied from another one
+            'uid': uuid.uuid4().hex,
             'description': description,
             'status': 'todo',
             'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             'updated_at': None
         }
+        self._touch(task)
         
         self.tasks.append(task)
         self._save_tasks()
@@ -107,6 +155,7 @@ class TaskTracker:
         
         task['description'] = new_description
         task['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._touch(task)
         self._save_tasks()
         print(f"Task {task_id} updated successfully")
     
@@ -118,6 +167,15 @@ class TaskTracker:
             return
         
         self.tasks = [task for task in self.tasks if task['id'] != task_id]
+        # Keep a tombstone so the delete replicates to other hosts
+        tombstone = {
+            'id': task_id,
+            'uid': task['uid'],
+            'version': task['version'],
+            'deleted_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self._touch(tombstone)
+        self.deleted.append(tombstone)
         self._save_tasks()
         print(f"Task {task_id} deleted successfully")
     
@@ -142,6 +200,7 @@ class TaskTracker:
         
         task['status'] = status
         task['updated_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._touch(task)
         self._save_tasks()
         print(f"Task {task_id} {action} successfully")
     
@@ -173,6 +232,87 @@ class TaskTracker:
                 self._print_task(task)
             print(f"Total: {len(self.tasks)} task(s)")
     
+    def export_changes(self, since: int = 0) -> Dict[str, Any]:
+        """
+        Build a change feed: every task and tombstone changed after sequence
+        number `since`, as full records. Imported changes get a new local
+        sequence number too, so a host can pass on changes it received.
+        """
+        changes = [
+            {key: value for key, value in task.items() if key != 'seq'}
+            for task in self.tasks + [dict(tombstone, deleted=True) for tombstone in self.deleted]
+            if task['seq'] > since
+        ]
+        changes.sort(key=lambda record: record['uid'])
+        return {'replica': self.replica, 'since': since, 'seq': self.seq, 'changes': changes}
+
+    def import_changes(self, feed: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        Merge a change feed from another replica.
+
+        Each task converges to the record with the highest (version, origin),
+        so every replica ends up with the same result whatever order feeds
+        arrive in. Returns (applied, skipped).
+
+        Raises ValueError for a feed exported by this same replica ID, which
+        means tasks.json was copied from the other host.
+        """
+        if feed['replica'] == self.replica:
+            raise ValueError(
+                f"Feed comes from this replica ({self.replica}); if tasks.json was copied from "
+                f"the other host, run 'replica new' on one of them first"
+            )
+        live = {task['uid']: task for task in self.tasks}
+        tombstones = {tombstone['uid']: tombstone for tombstone in self.deleted}
+        applied = skipped = 0
+
+        for record in feed['changes']:
+            uid = record['uid']
+            local = live.get(uid) or tombstones.get(uid)
+            if local is not None and change_rank(local) >= change_rank(record):
+                skipped += 1
+                continue
+
+            self.seq += 1
+            incoming = {key: value for key, value in record.items() if key != 'deleted'}
+            incoming['seq'] = self.seq
+            if record.get('deleted'):
+                live.pop(uid, None)
+                tombstones[uid] = incoming
+            else:
+                tombstones.pop(uid, None)
+                current = live.get(uid)
+                if current is not None:
+                    incoming['id'] = current['id']
+                elif any(task['id'] == incoming['id'] for task in live.values()):
+                    # Same display ID used by a different task here: renumber locally
+                    incoming['id'] = max([task['id'] for task in live.values()] + [self.next_id - 1]) + 1
+                live[uid] = incoming
+            applied += 1
+
+        if applied:
+            self.tasks = sorted(live.values(), key=lambda task: task['id'])
+            self.deleted = list(tombstones.values())
+            self.next_id = self._get_next_id()
+        self.peers[feed['replica']] = max(self.peers.get(feed['replica'], 0), feed['seq'])
+        self._save_tasks()
+        return applied, skipped
+
+    def new_replica(self) -> None:
+        """Give this host a fresh replica ID, for a tasks.json copied from another host"""
+        old = self.replica
+        self.replica = uuid.uuid4().hex[:12]
+        self._save_tasks()
+        print(f"Replica ID changed from {old} to {self.replica}")
+
+    def replica_status(self) -> None:
+        """Show this replica's ID, sequence number and sync cursors"""
+        print(f"Replica: {self.replica}")
+        print(f"Sequence: {self.seq}")
+        print(f"Tasks: {len(self.tasks)} ({len(self.deleted)} deleted)")
+        for replica, seq in sorted(self.peers.items()):
+            print(f"  Imported from {replica} up to {seq} (use: export {seq})")
+
     def summary(self) -> None:
         """Show a summary of tasks by status"""
         if not self.tasks:
@@ -212,6 +352,10 @@ Usage:
   python3 task_tracker.py list in-progress            List in-progress tasks
   python3 task_tracker.py list done                   List done tasks
   python3 task_tracker.py summary                     Show task summary
+  python3 task_tracker.py export [since] [file]       Export changes after sequence number
+  python3 task_tracker.py import <file|->             Merge a change feed from another host
+  python3 task_tracker.py replica                     Show replica ID and sync cursors
+  python3 task_tracker.py replica new                 Pick a new replica ID (after copying tasks.json)
   python3 task_tracker.py help                        Show this help message
 
 Examples:
@@ -219,6 +363,9 @@ Examples:
   python3 task_tracker.py update 1 "Buy groceries and cook dinner"
   python3 task_tracker.py mark-done 1
   python3 task_tracker.py list done
+
+Sync between hosts (only changes since the last import are sent):
+  ssh host-a python3 task_tracker.py export 42 | python3 task_tracker.py import -
     """)
 
 
@@ -276,6 +423,40 @@ def main() -> None:
         elif command == "summary":
             tracker.summary()
         
+        elif command == "export":
+            since = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+            feed = json.dumps(tracker.export_changes(since), indent=2)
+            if len(sys.argv) > 3:
+                with open(sys.argv[3], 'w') as f:
+                    f.write(feed)
+            else:
+                print(feed)
+        
+        elif command == "import":
+            if len(sys.argv) < 3:
+                print("Error: Missing feed file")
+                print("Usage: task-cli import <file|->")
+                sys.exit(1)
+            if sys.argv[2] == "-":
+                feed = json.load(sys.stdin)
+            else:
+                with open(sys.argv[2], 'r') as f:
+                    feed = json.load(f)
+            try:
+                applied, skipped = tracker.import_changes(feed)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+            print(f"Imported {applied} change(s) from replica {feed['replica']}, "
+                  f"skipped {skipped} older or already known")
+            print(f"Next sync: export {feed['seq']}")
+        
+        elif command == "replica":
+            if len(sys.argv) > 2 and sys.argv[2] == "new":
+                tracker.new_replica()
+            else:
+                tracker.replica_status()
+        
         elif command in ["help", "--help", "-h"]:
             print_usage()
         
@@ -0,0 +1,141 @@
+"""Cold-start check: import cost of main.py against an eager-import reference, and time until /ready answers 200"""
+
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Tuple
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Heavy modules main.py must only import on first use or during warm-up
+LAZY_MODULES = ("numpy", "jinja2", "cProfile", "pstats", "streaming", "fastapi.staticfiles")
+
+# What importing main would cost if every lazy module were still imported up front
+EAGER_REFERENCE = LAZY_MODULES + ("main",)
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_profile(modules: Tuple[str, ...] = ("main",)) -> Tuple[int, Dict[str, int]]:
+    """
+    Import modules in a fresh interpreter.
+
+    Returns their combined cumulative time and the per-module self times (µs).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    total = 0
+    self_times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        self_times[module] = int(self_us)
+        if module in modules and not indent:
+            total += int(cumulative_us)
+    return total, self_times
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_ready(timeout: float) -> float:
+    """Start a single-worker server and return the seconds until /ready answers 200"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/ready"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--host", "127.0.0.1", "--port", str(port), "--workers", "1"],
+        cwd=APP_DIR, stdout=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with status {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            time.sleep(0.01)
+        raise RuntimeError(f"/ready did not answer 200 within {timeout:g}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check the converter's cold-start cost against a budget")
+    parser.add_argument("--min-saving", type=float, default=float(os.environ.get("IMPORT_MIN_SAVING", "10")),
+                        help="Minimum import time saved versus importing everything eagerly, in percent "
+                             "(default: IMPORT_MIN_SAVING or 10)")
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.environ["IMPORT_BUDGET_MS"]) if os.environ.get("IMPORT_BUDGET_MS") else None,
+                        help="Also enforce an absolute import time in ms (default: IMPORT_BUDGET_MS, else off)")
+    parser.add_argument("--runs", type=int, default=7,
+                        help="Fresh interpreter pairs to sample (default: 7)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list (default: 10)")
+    parser.add_argument("--serve", action="store_true", help="Also measure process start until /ready answers 200")
+    parser.add_argument("--ready-budget-ms", type=float, default=None, help="Maximum time to ready in ms")
+    args = parser.parse_args()
+
+    # Each run imports main and the eager reference back to back, so machine
+    # noise hits both alike; the median of the paired savings is what's checked
+    samples: List[int] = []
+    reference_samples: List[int] = []
+    savings: List[float] = []
+    self_times: Dict[str, int] = {}
+    for _ in range(args.runs):
+        total, self_times = import_profile()
+        reference, _ = import_profile(EAGER_REFERENCE)
+        samples.append(total)
+        reference_samples.append(reference)
+        savings.append((1 - total / reference) * 100)
+    best_ms = min(samples) / 1000
+    reference_ms = min(reference_samples) / 1000
+    saving = statistics.median(savings)
+
+    failures = []
+    print(f"import main: best {best_ms:.1f} ms over {args.runs} run(s)")
+    print(f"eager reference: best {reference_ms:.1f} ms; median saving {saving:.0f}% "
+          f"(minimum {args.min_saving:g}%)")
+    if saving < args.min_saving:
+        failures.append(f"import saving {saving:.0f}% is below the minimum of {args.min_saving:g}%")
+    if args.budget_ms is not None and best_ms > args.budget_ms:
+        failures.append(f"import time {best_ms:.1f} ms exceeds budget of {args.budget_ms:g} ms")
+
+    eager = [module for module in LAZY_MODULES if module in self_times]
+    if eager:
+        failures.append("imported eagerly: " + ", ".join(eager))
+
+    print("slowest modules (self time):")
+    for module, self_us in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {module}")
+
+    if args.serve:
+        ready_ms = time_to_ready(timeout=30) * 1000
+        print(f"time to ready: {ready_ms:.0f} ms")
+        if args.ready_budget_ms is not None and ready_ms > args.ready_budget_ms:
+            failures.append(f"time to ready {ready_ms:.0f} ms exceeds budget of {args.ready_budget_ms:g} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
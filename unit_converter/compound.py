@@ -0,0 +1,151 @@
+import re
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from units import DIMENSIONS, Converter, UnknownUnitError
+
+# Exponents over the base quantities (length, mass, time, data)
+Vector = Tuple[int, int, int, int]
+BASE_SYMBOLS = ('m', 'kg', 's', 'B')
+
+# Registered dimensions usable inside expressions: vector and the size of the
+# dimension's base unit in coherent base units (a liter is 1/1000 m³)
+DIMENSION_VECTORS: Dict[str, Tuple[Vector, Fraction]] = {
+    'length': ((1, 0, 0, 0), Fraction(1)),
+    'weight': ((0, 1, 0, 0), Fraction(1)),
+    'time': ((0, 0, 1, 0), Fraction(1)),
+    'data': ((0, 0, 0, 1), Fraction(1)),
+    'area': ((2, 0, 0, 0), Fraction(1)),
+    'volume': ((3, 0, 0, 0), Fraction(1, 1000)),
+    'speed': ((1, 0, -1, 0), Fraction(1)),
+}
+
+# Named derived units: (factor in coherent base units, vector)
+DERIVED_UNITS: Dict[str, Tuple[Fraction, Vector]] = {
+    'newton': (Fraction(1), (1, 1, -2, 0)),
+    'joule': (Fraction(1), (2, 1, -2, 0)),
+    'watt': (Fraction(1), (2, 1, -3, 0)),
+    'pascal': (Fraction(1), (-1, 1, -2, 0)),
+    'hertz': (Fraction(1), (0, 0, -1, 0)),
+}
+
+# Short symbols for unit names
+SYMBOLS = {
+    'mm': 'millimeter', 'cm': 'centimeter', 'm': 'meter', 'km': 'kilometer',
+    'in': 'inch', 'ft': 'foot', 'yd': 'yard', 'mi': 'mile',
+    'mg': 'milligram', 'g': 'gram', 'kg': 'kilogram', 'oz': 'ounce', 'lb': 'pound',
+    'ms': 'millisecond', 's': 'second', 'min': 'minute', 'h': 'hour', 'd': 'day',
+    'ml': 'milliliter', 'mL': 'milliliter', 'l': 'liter', 'L': 'liter',
+    'B': 'byte', 'kB': 'kilobyte', 'MB': 'megabyte', 'GB': 'gigabyte', 'TB': 'terabyte',
+    'KiB': 'kibibyte', 'MiB': 'mebibyte', 'GiB': 'gibibyte', 'TiB': 'tebibyte',
+    'mph': 'mile_per_hour', 'kn': 'knot',
+    'N': 'newton', 'J': 'joule', 'W': 'watt', 'Pa': 'pascal', 'Hz': 'hertz',
+}
+
+SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹⁻·⋅×', '0123456789-***')
+TOKEN = re.compile(r'[*/]|[^*/\s]+')
+# A unit name with an optional exponent; a bare '^' is rejected
+FACTOR = re.compile(r'([A-Za-z_]+)(?:\^?(-?\d+))?')
+
+# Bounds on expressions, so exact factors stay small: |exponent| per factor
+# and number of factors (tokens) per expression
+MAX_EXPONENT = 12
+MAX_FACTORS = 16
+
+
+class IncompatibleUnitsError(ValueError):
+    """Raised when two unit expressions measure different quantities"""
+
+
+@lru_cache(maxsize=None)
+def unit_definition(name: str) -> Tuple[Fraction, Vector]:
+    """Factor (in coherent base units) and dimension vector of one named unit or symbol"""
+    name = SYMBOLS.get(name, name)
+    if name in DERIVED_UNITS:
+        return DERIVED_UNITS[name]
+    for dimension_name, (vector, base_scale) in DIMENSION_VECTORS.items():
+        dimension = DIMENSIONS.get(dimension_name)
+        if dimension is not None and name in dimension.exact_units:
+            scale, _ = dimension.exact_units[name]
+            return scale * base_scale, vector
+    raise UnknownUnitError(f"Unknown unit '{name}'")
+
+
+@lru_cache(maxsize=1024)
+def parse_unit(expression: str) -> Tuple[Fraction, Vector]:
+    """
+    Parse an expression such as ``km/h``, ``kg·m/s²`` or ``kg*m*s^-2``.
+
+    Factors are multiplied by ``*``, ``·`` or whitespace and divided by ``/``,
+    which applies to the next factor only (``m/s/s`` is ``m/s²``).
+    """
+    factor = Fraction(1)
+    vector = [0, 0, 0, 0]
+    sign = 1
+    pending = False
+    tokens = TOKEN.findall(expression.translate(SUPERSCRIPTS))
+    if sum(token not in '*/' for token in tokens) > MAX_FACTORS:
+        raise UnknownUnitError(f"Unit expression '{expression}' has more than {MAX_FACTORS} factors")
+    for token in tokens:
+        if token in '*/':
+            sign = -1 if token == '/' else 1
+            pending = True
+            continue
+        pending = False
+        if token == '1':
+            continue
+        match = FACTOR.fullmatch(token)
+        if match is None:
+            raise UnknownUnitError(f"Cannot parse '{token}' in unit '{expression}'")
+        name, power = match.groups()
+        # Length check first so a huge digit string is never parsed
+        if power is not None and (len(power) > 6 or abs(int(power)) > MAX_EXPONENT):
+            raise UnknownUnitError(f"Exponent of '{token}' in unit '{expression}' exceeds {MAX_EXPONENT}")
+        power = sign * int(power or 1)
+        unit_factor, unit_vector = unit_definition(name)
+        factor *= unit_factor ** power
+        for i, exponent in enumerate(unit_vector):
+            vector[i] += exponent * power
+        sign = 1
+    if pending or not expression.strip():
+        raise UnknownUnitError(f"Incomplete unit expression '{expression}'")
+    return factor, tuple(vector)
+
+
+def describe(vector: Vector) -> str:
+    """Render a dimension vector in base units, e.g. m·kg·s^-2"""
+    parts = [symbol if power == 1 else f"{symbol}^{power}"
+             for symbol, power in zip(BASE_SYMBOLS, vector) if power]
+    return '·'.join(parts) or 'dimensionless'
+
+
+@lru_cache(maxsize=1024)
+def compound_factor(from_unit: str, to_unit: str) -> Fraction:
+    """Exact factor between two unit expressions of the same dimension"""
+    from_factor, from_vector = parse_unit(from_unit)
+    to_factor, to_vector = parse_unit(to_unit)
+    if from_vector != to_vector:
+        raise IncompatibleUnitsError(
+            f"Cannot convert '{from_unit}' ({describe(from_vector)}) to '{to_unit}' ({describe(to_vector)})"
+        )
+    return from_factor / to_factor
+
+
+class CompoundUnits(Converter):
+    """Converts between parsed unit expressions instead of a fixed unit table"""
+
+    name = 'compound'
+
+    def factors(self, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        try:
+            return float(compound_factor(from_unit, to_unit)), 0.0
+        except OverflowError:
+            # Beyond float range: results come out as inf and the API answers 422
+            return float('inf'), 0.0
+
+    def exact_factors(self, from_unit: str, to_unit: str) -> Tuple[Fraction, Fraction]:
+        return compound_factor(from_unit, to_unit), Fraction(0)
+
+
+COMPOUND = CompoundUnits()
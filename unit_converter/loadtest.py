@@ -0,0 +1,131 @@
+"""Local load generator: measures requests/sec and p50/p99 latency per endpoint"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlencode, urlparse
+
+# name -> (method, path, content type, body)
+SCENARIOS: Dict[str, Tuple[str, str, str, bytes]] = {
+    "home": ("GET", "/", "", b""),
+    "length-page": ("GET", "/length", "", b""),
+    "length-convert": ("POST", "/length", "application/x-www-form-urlencoded",
+                       urlencode({"from_value": "42", "from_unit": "mile", "to_unit": "kilometer"}).encode()),
+    "temperature-convert": ("POST", "/temperature", "application/x-www-form-urlencoded",
+                            urlencode({"from_value": "98.6", "from_unit": "fahrenheit", "to_unit": "celsius"}).encode()),
+    "api-batch": ("POST", "/api/convert", "application/json",
+                  json.dumps({"dimension": "length", "from_unit": "mile", "to_unit": "kilometer",
+                              "values": list(range(1000))}).encode()),
+}
+
+
+def build_request(host: str, method: str, path: str, content_type: str, body: bytes) -> bytes:
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+    if body:
+        lines += [f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response off a keep-alive connection and return its status code"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in header_lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    return int(status_line.split()[1])
+
+
+async def connection_worker(host: str, port: int, request: bytes, deadline: float,
+                            latencies: List[float], errors: List[int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            try:
+                status = await read_response(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                errors.append(0)
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, port)
+                continue
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_scenario(url: str, scenario: str, connections: int, duration: float) -> Tuple[List[float], int]:
+    parsed = urlparse(url)
+    host, port = parsed.hostname, parsed.port or 80
+    method, path, content_type, body = SCENARIOS[scenario]
+    request = build_request(f"{host}:{port}", method, path, content_type, body)
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        connection_worker(host, port, request, deadline, latencies, errors)
+        for _ in range(connections)
+    ))
+    return latencies, len(errors)
+
+
+def scenario_process(args: Tuple[str, str, int, float]) -> Tuple[List[float], int]:
+    return asyncio.run(run_scenario(*args))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    index = max(0, min(len(samples) - 1, round(pct / 100 * len(samples)) - 1))
+    return samples[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the Unit Converter")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Server base URL (default: http://127.0.0.1:8000)")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help="Endpoints to test (default: all)")
+    parser.add_argument("--connections", type=int, default=32, help="Keep-alive connections per process (default: 32)")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario (default: 10)")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="Load generator processes, so the client is not the bottleneck (default: 1)")
+    args = parser.parse_args()
+
+    print(f"Target {args.url}: {args.processes} process(es) x {args.connections} connection(s), "
+          f"{args.duration:g}s per scenario")
+    print(f"{'scenario':<22} {'requests':>9} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+
+    with multiprocessing.Pool(args.processes) as pool:
+        for scenario in args.scenarios:
+            jobs = [(args.url, scenario, args.connections, args.duration)] * args.processes
+            latencies: List[float] = []
+            errors = 0
+            for partial, partial_errors in pool.map(scenario_process, jobs):
+                latencies.extend(partial)
+                errors += partial_errors
+            latencies.sort()
+            print(f"{scenario:<22} {len(latencies):>9} {len(latencies) / args.duration:>10,.1f} "
+                  f"{percentile(latencies, 50) * 1000:>8.2f} {percentile(latencies, 99) * 1000:>8.2f} {errors:>7}")
+
+
+if __name__ == "__main__":
+    main()
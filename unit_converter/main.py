@@ -1,108 +1,210 @@
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from typing import Optional
+import time
+
+# Cold-start timings reported by /ready
+IMPORT_STARTED = time.perf_counter()
+
+import hashlib
+import json
+import math
+import os
+import threading
+from functools import lru_cache
+
+from fastapi import FastAPI, Request, Form, HTTPException, Query
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
+from pydantic import BaseModel, Field
+from typing import Callable, List, Optional, Tuple
+
+from cache import TTLCache
+from metrics import CONVERSION_TIME, REGISTRY, RENDER_TIME, MetricsMiddleware, SlowRequestLog
+from compound import COMPOUND, IncompatibleUnitsError
+from units import (DEFAULT_DIGITS, DIMENSIONS, Converter, UnknownUnitError, convert, format_exact,
+                   get_dimension, to_fraction)
+
+# numpy, Jinja2 and the streaming helpers are imported on first use (or during
+# warm-up) rather than here; check_startup.py keeps the import cost in budget
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 app = FastAPI(title="Unit Converter")
 
-# Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Per-route request metrics; SLOW_REQUEST_MS enables the slow request log and
+# PROFILE_SAMPLE_RATE (0-1) the fraction of requests run under cProfile
+slow_log = SlowRequestLog(
+    float(os.environ["SLOW_REQUEST_MS"]) / 1000 if os.environ.get("SLOW_REQUEST_MS") else None,
+    float(os.environ.get("PROFILE_SAMPLE_RATE", "0")),
+)
+app.add_middleware(MetricsMiddleware, slow_log=slow_log)
+
+PAGE_TEMPLATES = ("index.html", "length.html", "weight.html", "temperature.html")
+
+@lru_cache(maxsize=None)
+def get_static_files():
+    """StaticFiles app, built on first use"""
+    from fastapi.staticfiles import StaticFiles
+    return StaticFiles(directory=os.path.join(BASE_DIR, "static"))
+
+async def static_files(scope, receive, send):
+    await get_static_files()(scope, receive, send)
+
+# Mount static files and templates, relative to this file rather than the CWD
+app.mount("/static", static_files, name="static")
+
+@lru_cache(maxsize=None)
+def get_templates():
+    """Jinja2 environment, built on first use"""
+    from fastapi.templating import Jinja2Templates
+    templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
+    # Templates never change while the server runs, so skip the per-request mtime check
+    templates.env.auto_reload = False
+    return templates
+
+# Readiness state: "ready" flips once warm-up has finished
+readiness = {"ready": False, "import_seconds": None, "templates_seconds": None, "warmup_seconds": None}
+
+def warm_numpy():
+    """Pay for the numpy import and first vector conversion before taking API traffic"""
+    started = time.perf_counter()
+    LENGTH.convert_array([1.0], "meter", "kilometer")
+    readiness["warmup_seconds"] = round(time.perf_counter() - started, 4)
+    readiness["ready"] = True
+
+@app.on_event("startup")
+def warm_up():
+    """Compile every page template up front (a missing or broken one fails startup),
+    then finish warming in the background so the server can start listening"""
+    started = time.perf_counter()
+    get_static_files()
+    templates = get_templates()
+    for name in PAGE_TEMPLATES:
+        templates.get_template(name)
+    readiness["templates_seconds"] = round(time.perf_counter() - started, 4)
+    threading.Thread(target=warm_numpy, name="warm-up", daemon=True).start()
+
+LENGTH = DIMENSIONS['length']
+WEIGHT = DIMENSIONS['weight']
+TEMPERATURE = DIMENSIONS['temperature']
 
 # Conversion functions
 class UnitConverter:
+    """Thin wrapper over the table-driven engine in units.py"""
+
+    @staticmethod
+    def convert(dimension: str, value: float, from_unit: str, to_unit: str) -> float:
+        """Convert between two units of any registered dimension"""
+        return convert(dimension, value, from_unit, to_unit)
+
     @staticmethod
     def convert_length(value: float, from_unit: str, to_unit: str) -> float:
         """Convert length units"""
-        # Convert to meters first
-        to_meter = {
-            'millimeter': value / 1000,
-            'centimeter': value / 100,
-            'meter': value,
-            'kilometer': value * 1000,
-            'inch': value * 0.0254,
-            'foot': value * 0.3048,
-            'yard': value * 0.9144,
-            'mile': value * 1609.34
-        }
-        
-        meters = to_meter.get(from_unit, value)
-        
-        # Convert from meters to target unit
-        from_meter = {
-            'millimeter': meters * 1000,
-            'centimeter': meters * 100,
-            'meter': meters,
-            'kilometer': meters / 1000,
-            'inch': meters / 0.0254,
-            'foot': meters / 0.3048,
-            'yard': meters / 0.9144,
-            'mile': meters / 1609.34
-        }
-        
-        return from_meter.get(to_unit, value)
+        return LENGTH.convert(value, from_unit, to_unit)
     
     @staticmethod
     def convert_weight(value: float, from_unit: str, to_unit: str) -> float:
         """Convert weight units"""
-        # Convert to kilograms first
-        to_kilogram = {
-            'milligram': value / 1000000,
-            'gram': value / 1000,
-            'kilogram': value,
-            'ounce': value * 0.0283495,
-            'pound': value * 0.453592
-        }
-        
-        kilograms = to_kilogram.get(from_unit, value)
-        
-        # Convert from kilograms to target unit
-        from_kilogram = {
-            'milligram': kilograms * 1000000,
-            'gram': kilograms * 1000,
-            'kilogram': kilograms,
-            'ounce': kilograms / 0.0283495,
-            'pound': kilograms / 0.453592
-        }
-        
-        return from_kilogram.get(to_unit, value)
+        return WEIGHT.convert(value, from_unit, to_unit)
     
     @staticmethod
     def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
         """Convert temperature units"""
-        if from_unit == to_unit:
-            return value
-            
-        # Convert to Celsius first
-        if from_unit == 'celsius':
-            celsius = value
-        elif from_unit == 'fahrenheit':
-            celsius = (value - 32) * 5/9
-        elif from_unit == 'kelvin':
-            celsius = value - 273.15
-        
-        # Convert from Celsius to target unit
-        if to_unit == 'celsius':
-            return celsius
-        elif to_unit == 'fahrenheit':
-            return (celsius * 9/5) + 32
-        elif to_unit == 'kelvin':
-            return celsius + 273.15
-        
-        return value
+        return TEMPERATURE.convert(value, from_unit, to_unit)
 
 converter = UnitConverter()
 
+# JSON API models
+class ConvertRequest(BaseModel):
+    # Omit to convert between unit expressions such as "km/h" and "m/s"
+    dimension: Optional[str] = None
+    from_unit: Optional[str] = None
+    to_unit: Optional[str] = None
+    values: Optional[List[float]] = None
+    items: Optional[List[Tuple[float, str, str]]] = None
+    precision: Optional[int] = Field(None, ge=0, le=15)
+    # Exact mode: rational arithmetic, results as decimal strings with up to `digits` significant digits
+    exact: bool = False
+    digits: Optional[int] = Field(None, ge=1, le=1000)
+
+def json_response(content: dict, status_code: int = 200) -> Response:
+    """Compact JSON response without FastAPI's per-item encoding pass"""
+    return Response(json.dumps(content, separators=(',', ':')), status_code=status_code,
+                    media_type="application/json")
+
+# Rendered page cache
+PAGE_CACHE_TTL = float(os.environ.get("PAGE_CACHE_TTL", "300"))
+page_cache = TTLCache(maxsize=int(os.environ.get("PAGE_CACHE_SIZE", "4096")), ttl=PAGE_CACHE_TTL)
+
+CACHE_HITS = REGISTRY.counter("unit_converter_page_cache_hits_total", "Rendered page cache hits.")
+CACHE_MISSES = REGISTRY.counter("unit_converter_page_cache_misses_total", "Rendered page cache misses.")
+CACHE_HIT_RATIO = REGISTRY.gauge("unit_converter_page_cache_hit_ratio", "Rendered page cache hit ratio.")
+CACHE_ENTRIES = REGISTRY.gauge("unit_converter_page_cache_entries", "Rendered pages currently cached.")
+
+def collect_cache_metrics():
+    CACHE_HITS.set(value=page_cache.hits)
+    CACHE_MISSES.set(value=page_cache.misses)
+    CACHE_HIT_RATIO.set(value=page_cache.hit_ratio)
+    CACHE_ENTRIES.set(value=len(page_cache))
+
+REGISTRY.add_collector(collect_cache_metrics)
+
+def render_cached(request: Request, key: tuple, template: str,
+                  make_context: Callable[[], dict], block: Optional[str] = None) -> Tuple[bytes, str]:
+    """Render a template (or just one of its blocks) once per cache key and return (body, etag)"""
+    def render() -> Tuple[bytes, str]:
+        context = {"request": request, **make_context()}
+        compiled = get_templates().get_template(template)
+        with RENDER_TIME.time(f"{template}#{block}" if block else template):
+            if block:
+                # Render the block on its own, skipping the base.html inheritance chain
+                html = "".join(compiled.blocks[block](compiled.new_context(context)))
+            else:
+                html = compiled.render(context)
+        body = html.encode("utf-8")
+        return body, '"' + hashlib.sha1(body).hexdigest() + '"'
+    return page_cache.get_or_set(key, render)
+
+def wants_fragment(request: Request) -> bool:
+    """htmx sends HX-Request; plain fetch() callers can use ?partial=1 instead"""
+    return "hx-request" in request.headers or request.query_params.get("partial") == "1"
+
+def page_response(request: Request, template: str, context: dict) -> Response:
+    """Cached static GET page with ETag / Cache-Control and 304 revalidation"""
+    body, etag = render_cached(request, ("GET", request.url.path), template, lambda: context)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={int(PAGE_CACHE_TTL)}"}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
+# Significant digits shown on the converter pages (results are computed exactly)
+DISPLAY_DIGITS = int(os.environ.get("DISPLAY_DIGITS", "15"))
+
+def conversion_response(request: Request, template: str, dimension: Converter, from_value: float,
+                        from_unit: str, to_unit: str) -> Response:
+    """Render a conversion result, reusing the HTML for repeated (value, from, to) inputs"""
+    def context() -> dict:
+        try:
+            with CONVERSION_TIME.time(request.url.path):
+                result = format_exact(dimension.convert_exact(from_value, from_unit, to_unit), DISPLAY_DIGITS)
+        except Exception as e:
+            result = f"Error: {str(e)}"
+        return {
+            "result": result,
+            "from_value": from_value,
+            "from_unit": from_unit,
+            "to_unit": to_unit
+        }
+
+    block = "result" if wants_fragment(request) else None
+    key = ("POST", request.url.path, repr(float(from_value)), from_unit, to_unit, block)
+    body, _ = render_cached(request, key, template, context, block)
+    return HTMLResponse(body, headers={"Vary": "HX-Request"})
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return page_response(request, "index.html", {})
 
 @app.get("/length", response_class=HTMLResponse)
 async def length_converter(request: Request):
-    return templates.TemplateResponse("length.html", {
-        "request": request,
+    return page_response(request, "length.html", {
         "result": None,
         "from_value": "",
         "from_unit": "meter",
@@ -116,28 +218,12 @@ async def convert_length(
     from_unit: str = Form(...),
     to_unit: str = Form(...)
 ):
-    try:
-        result = converter.convert_length(from_value, from_unit, to_unit)
-        return templates.TemplateResponse("length.html", {
-            "request": request,
-            "result": round(result, 6),
-            "from_value": from_value,
-            "from_unit": from_unit,
-            "to_unit": to_unit
-        })
-    except Exception as e:
-        return templates.TemplateResponse("length.html", {
-            "request": request,
-            "result": f"Error: {str(e)}",
-            "from_value": from_value,
-            "from_unit": from_unit,
-            "to_unit": to_unit
-        })
+    return conversion_response(request, "length.html", LENGTH,
+                               from_value, from_unit, to_unit)
 
 @app.get("/weight", response_class=HTMLResponse)
 async def weight_converter(request: Request):
-    return templates.TemplateResponse("weight.html", {
-        "request": request,
+    return page_response(request, "weight.html", {
         "result": None,
         "from_value": "",
         "from_unit": "kilogram",
@@ -151,28 +237,12 @@ async def convert_weight(
     from_unit: str = Form(...),
     to_unit: str = Form(...)
 ):
-    try:
-        result = converter.convert_weight(from_value, from_unit, to_unit)
-        return templates.TemplateResponse("weight.html", {
-            "request": request,
-            "result": round(result, 6),
-            "from_value": from_value,
-            "from_unit": from_unit,
-            "to_unit": to_unit
-        })
-    except Exception as e:
-        return templates.TemplateResponse("weight.html", {
-            "request": request,
-            "result": f"Error: {str(e)}",
-            "from_value": from_value,
-            "from_unit": from_unit,
-            "to_unit": to_unit
-        })
+    return conversion_response(request, "weight.html", WEIGHT,
+                               from_value, from_unit, to_unit)
 
 @app.get("/temperature", response_class=HTMLResponse)
 async def temperature_converter(request: Request):
-    return templates.TemplateResponse("temperature.html", {
-        "request": request,
+    return page_response(request, "temperature.html", {
         "result": None,
         "from_value": "",
         "from_unit": "celsius",
@@ -186,23 +256,159 @@ async def convert_temperature(
     from_unit: str = Form(...),
     to_unit: str = Form(...)
 ):
+    return conversion_response(request, "temperature.html", TEMPERATURE,
+                               from_value, from_unit, to_unit)
+
+# JSON API
+@app.get("/api/units")
+async def list_units():
+    return json_response({
+        name: {"base_unit": dimension.base_unit, "units": list(dimension.units)}
+        for name, dimension in DIMENSIONS.items()
+    })
+
+def exact_results(dimension: Converter, payload: ConvertRequest) -> List[str]:
+    """Convert with rational arithmetic; results are decimal strings so no digits are lost"""
+    digits = payload.digits or DEFAULT_DIGITS
+    if payload.values is not None:
+        factor, offset = dimension.exact_factors(payload.from_unit, payload.to_unit)
+        return [format_exact(to_fraction(value) * factor + offset, digits, payload.precision)
+                for value in payload.values]
+    return [format_exact(dimension.convert_exact(value, from_unit, to_unit), digits, payload.precision)
+            for value, from_unit, to_unit in payload.items]
+
+@app.post("/api/convert")
+def convert_batch(payload: ConvertRequest):
+    """
+    Convert many values at once.
+
+    Either send ``values`` with a shared ``from_unit``/``to_unit``, or
+    ``items`` as ``[value, from_unit, to_unit]`` triples. Without a
+    ``dimension`` the units are parsed as expressions such as ``km/h``.
+    """
+    import numpy as np
+
+    if (payload.values is None) == (payload.items is None):
+        raise HTTPException(status_code=422, detail="Provide exactly one of 'values' or 'items'")
+    if payload.values is not None and (not payload.from_unit or not payload.to_unit):
+        raise HTTPException(status_code=422, detail="'values' requires 'from_unit' and 'to_unit'")
+    # NaN and values that overflowed to inf have no exact (rational) value
+    if payload.exact and not all(math.isfinite(value) for value in (
+            payload.values if payload.values is not None else (item[0] for item in payload.items))):
+        raise HTTPException(status_code=422, detail="Exact mode requires finite values")
+
     try:
-        result = converter.convert_temperature(from_value, from_unit, to_unit)
-        return templates.TemplateResponse("temperature.html", {
-            "request": request,
-            "result": round(result, 6),
-            "from_value": from_value,
-            "from_unit": from_unit,
-            "to_unit": to_unit
-        })
-    except Exception as e:
-        return templates.TemplateResponse("temperature.html", {
-            "request": request,
-            "result": f"Error: {str(e)}",
-            "from_value": from_value,
-            "from_unit": from_unit,
-            "to_unit": to_unit
-        })
+        dimension = get_dimension(payload.dimension) if payload.dimension else COMPOUND
+        if payload.exact:
+            with CONVERSION_TIME.time("/api/convert"):
+                results = exact_results(dimension, payload)
+        else:
+            # Overflow becomes inf and is reported below instead of warning per request
+            with np.errstate(over='ignore', invalid='ignore'), CONVERSION_TIME.time("/api/convert"):
+                if payload.values is not None:
+                    results = dimension.convert_array(payload.values, payload.from_unit, payload.to_unit)
+                else:
+                    values, from_units, to_units = zip(*payload.items) if payload.items else ((), (), ())
+                    results = dimension.convert_pairs(values, from_units, to_units)
+    except (UnknownUnitError, IncompatibleUnitsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not payload.exact:
+        if not np.isfinite(results).all():
+            raise HTTPException(status_code=422, detail="Conversion result out of range")
+        if payload.precision is not None:
+            results = np.round(results, payload.precision)
+        results = results.tolist()
+
+    content = {"dimension": dimension.name}
+    if payload.values is not None:
+        content["from_unit"] = payload.from_unit
+        content["to_unit"] = payload.to_unit
+    content["results"] = results
+    return json_response(content)
+
+@app.post("/api/convert/stream")
+async def convert_stream(
+    request: Request,
+    dimension: str,
+    from_unit: str,
+    to_unit: str,
+    column: str,
+    output_column: Optional[str] = None,
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    precision: Optional[int] = Query(None, ge=0, le=15)
+):
+    """
+    Convert one column of a (chunked) CSV or NDJSON upload.
+
+    The body is converted chunk by chunk as it arrives and streamed back,
+    so memory stays bounded regardless of upload size.
+    """
+    from streaming import StreamConverter, UploadStreamingResponse, iter_line_batches
+
+    try:
+        stream_converter = StreamConverter(
+            get_dimension(dimension), from_unit, to_unit, column, output_column, precision
+        )
+    except UnknownUnitError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+
+    batches = iter_line_batches(request.stream())
+
+    if format == "ndjson":
+        async def body():
+            async for batch in batches:
+                with CONVERSION_TIME.time("/api/convert/stream"):
+                    chunk = stream_converter.ndjson_batch(batch)
+                yield chunk
+
+        return UploadStreamingResponse(body(), media_type="application/x-ndjson")
+
+    # CSV: read up to the header line first so a bad column is still a clean 400
+    # batches.__anext__ rather than anext(), which needs Python 3.10
+    try:
+        first = await batches.__anext__()
+    except StopAsyncIteration:
+        first = []
+    if not first:
+        raise HTTPException(status_code=400, detail="Empty CSV upload")
+    try:
+        header = stream_converter.csv_header(first[0])
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=e.args[0])
+
+    def convert_csv(batch: List[str]) -> str:
+        with CONVERSION_TIME.time("/api/convert/stream"):
+            return stream_converter.csv_batch(batch)
+
+    async def body():
+        yield header
+        if len(first) > 1:
+            yield convert_csv(first[1:])
+        async for batch in batches:
+            yield convert_csv(batch)
+
+    return UploadStreamingResponse(body(), media_type="text/csv")
+
+# Monitoring
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/metrics/slow", response_class=PlainTextResponse)
+async def slow_requests():
+    return PlainTextResponse(slow_log.render())
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 503 until warm-up has finished, then 200 with cold-start timings"""
+    return json_response(readiness, status_code=200 if readiness["ready"] else 503)
+
+readiness["import_seconds"] = round(time.perf_counter() - IMPORT_STARTED, 4)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,329 @@
+import io
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import cProfile
+
+# Latency buckets in seconds, finer than the Prometheus defaults because most
+# requests here finish well under 10ms
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """Sample value without rounding: counters stay exact past a million"""
+    if isinstance(value, int):
+        return str(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metric(ABC):
+    """Base class for a labelled metric family"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Exposition lines for this metric family, starting with its header"""
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        # Integer increments keep the count an int, so it renders exactly
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, *labels: str, value: float) -> None:
+        """Set the current value; for counters, a total kept elsewhere and copied in by a collector"""
+        with self._lock:
+            self._values[labels] = value
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def time(self, *labels: str) -> "_Timer":
+        """Context manager observing the elapsed time of its block"""
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, (counts, total) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound:g}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class _ProfileScope:
+    """
+    A sampled request's profiler, switched on only inside its timed blocks.
+
+    cProfile only sees the thread that enables it, so profiling from the
+    middleware would record whatever else the event loop ran meanwhile and
+    miss sync endpoints running in the threadpool. The scope travels with
+    the request's context instead (Starlette copies it into the threadpool),
+    and each _Timer enables it in the thread doing the work.
+    """
+
+    __slots__ = ("profiler", "depth", "used", "token")
+
+    def __init__(self, profiler: "cProfile.Profile"):
+        self.profiler = profiler
+        self.depth = 0
+        self.used = False
+        self.token = None
+
+    def enter(self) -> None:
+        if self.depth == 0:
+            self.profiler.enable()
+            self.used = True
+        self.depth += 1
+
+    def exit(self) -> None:
+        self.depth -= 1
+        if self.depth == 0:
+            self.profiler.disable()
+
+
+_active_profile: "ContextVar[Optional[_ProfileScope]]" = ContextVar("active_profile", default=None)
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.profile = _active_profile.get()
+        if self.profile is not None:
+            self.profile.enter()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+        if self.profile is not None:
+            self.profile.exit()
+
+
+class Registry:
+    """Collection of metrics rendered together in the text exposition format"""
+
+    def __init__(self):
+        self.metrics: List[Metric] = []
+        self.collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Register a callback that refreshes gauges right before each scrape"""
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self.collectors:
+            collector()
+        lines: List[str] = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP requests by method, route and status.", ("method", "route", "status"))
+REQUEST_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route.", ("method", "route"))
+IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight", "HTTP requests currently being processed.")
+CONVERSION_TIME = REGISTRY.histogram(
+    "unit_converter_conversion_seconds", "Time spent converting values, by route.", ("route",))
+RENDER_TIME = REGISTRY.histogram(
+    "unit_converter_render_seconds", "Time spent rendering templates, by template.", ("template",))
+
+
+class SlowRequestLog:
+    """
+    Keeps the most recent slow requests, optionally with a cProfile summary
+    of the request's own conversion and render blocks
+    """
+
+    def __init__(self, threshold: Optional[float], profile_rate: float = 0.0, maxlen: int = 50):
+        self.threshold = threshold
+        self.profile_rate = profile_rate
+        self.samples: deque = deque(maxlen=maxlen)
+        # Only one profiler can be active per process
+        self._profile_lock = threading.Lock()
+
+    def start_profile(self) -> Optional[_ProfileScope]:
+        """Maybe sample this request: attach a profiler to its context for the timers to use"""
+        if self.threshold is None or not self.profile_rate or random.random() >= self.profile_rate:
+            return None
+        if not self._profile_lock.acquire(blocking=False):
+            return None
+        import cProfile
+        scope = _ProfileScope(cProfile.Profile())
+        scope.token = _active_profile.set(scope)
+        return scope
+
+    def finish(self, profile: Optional[_ProfileScope], method: str, path: str, route: str,
+               status: int, duration: float) -> None:
+        stack = None
+        if profile is not None:
+            _active_profile.reset(profile.token)
+            self._profile_lock.release()
+            # Requests without a timed block (static files, /metrics) have nothing to show
+            if duration >= self.threshold and profile.used:
+                import pstats
+                buffer = io.StringIO()
+                pstats.Stats(profile.profiler, stream=buffer).sort_stats("cumulative").print_stats(15)
+                stack = buffer.getvalue()
+        if self.threshold is not None and duration >= self.threshold:
+            self.samples.append({
+                "time": time.time(),
+                "method": method,
+                "path": path,
+                "route": route,
+                "status": status,
+                "duration_ms": round(duration * 1000, 3),
+                "profile": stack,
+            })
+
+    def render(self) -> str:
+        if self.threshold is None:
+            return "Slow request logging is disabled (set SLOW_REQUEST_MS).\n"
+        parts = []
+        for sample in reversed(self.samples):
+            when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sample["time"]))
+            parts.append(f"{when} {sample['method']} {sample['path']} ({sample['route']}) "
+                         f"status={sample['status']} {sample['duration_ms']}ms")
+            if sample["profile"]:
+                parts.append(sample["profile"])
+        return "\n".join(parts) + "\n" if parts else "No slow requests recorded.\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and in-flight requests per route"""
+
+    def __init__(self, app, slow_log: Optional[SlowRequestLog] = None):
+        self.app = app
+        self.slow_log = slow_log
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        profile = self.slow_log.start_profile() if self.slow_log is not None else None
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            IN_FLIGHT.dec()
+            route = route_label(scope)
+            REQUESTS.inc(scope["method"], route, str(status))
+            REQUEST_LATENCY.observe(duration, scope["method"], route)
+            if self.slow_log is not None:
+                self.slow_log.finish(profile, scope["method"], scope["path"], route, status, duration)
+
+
+def route_label(scope) -> str:
+    """Use the route template (not the raw path) so label cardinality stays bounded"""
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    if scope.get("endpoint") is not None:
+        # Mounted apps (e.g. /static) set root_path to the mount prefix
+        return scope.get("root_path") or "mount"
+    return "unmatched"
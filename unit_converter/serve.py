@@ -0,0 +1,59 @@
+"""Production launcher: runs the converter across several uvicorn worker processes"""
+
+import argparse
+import importlib.util
+import os
+
+import uvicorn
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Unit Converter with multiple worker processes")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"), help="Bind address (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")), help="Port (default: 8000)")
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+                        help="Worker processes (default: WEB_CONCURRENCY or CPU count)")
+    parser.add_argument("--keep-alive", type=int, default=5,
+                        help="Seconds to keep idle connections open (default: 5)")
+    parser.add_argument("--backlog", type=int, default=2048,
+                        help="Maximum pending connections in the listen queue (default: 2048)")
+    parser.add_argument("--limit-concurrency", type=int, default=None,
+                        help="Per-worker concurrent connection cap before answering 503")
+    parser.add_argument("--log-level", default="warning", help="Uvicorn log level (default: warning)")
+    parser.add_argument("--access-log", action="store_true", help="Enable per-request access logging")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+
+    # Use the fast event loop and HTTP parser when installed, else the pure-Python defaults
+    loop = "uvloop" if has_module("uvloop") else "asyncio"
+    http = "httptools" if has_module("httptools") else "h11"
+    print(f"Starting Unit Converter on {args.host}:{args.port} "
+          f"with {args.workers} worker(s), loop={loop}, http={http}")
+
+    uvicorn.run(
+        "main:app",
+        app_dir=APP_DIR,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=args.keep_alive,
+        backlog=args.backlog,
+        limit_concurrency=args.limit_concurrency,
+        log_level=args.log_level,
+        access_log=args.access_log,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+// Submit converter forms in the background and swap in only the result fragment.
+// Without JavaScript the forms still post normally and get the full page back.
+document.addEventListener('submit', async (event) => {
+    const form = event.target.closest('.converter-form');
+    const target = document.getElementById('result');
+    if (!form || !target) {
+        return;
+    }
+    event.preventDefault();
+    try {
+        const response = await fetch(form.action, {
+            method: 'POST',
+            headers: { 'HX-Request': 'true' },
+            body: new URLSearchParams(new FormData(form)),
+        });
+        if (!response.ok) {
+            throw new Error(response.statusText);
+        }
+        target.innerHTML = await response.text();
+    } catch (error) {
+        form.submit();
+    }
+});
@@ -0,0 +1,146 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, List, Optional
+
+import numpy as np
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+
+from units import Dimension
+
+
+class UploadStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body is produced while the request body is still being read.
+
+    The stock implementation listens for client disconnects on ``receive()``
+    concurrently, which would swallow the upload chunks the body generator
+    is waiting for; a disconnect surfaces here as a failed send instead.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def iter_line_batches(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[str]]:
+    """Regroup an incoming byte stream into batches of complete lines, one batch per chunk"""
+    remainder = b''
+    try:
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            lines = (remainder + chunk).split(b'\n')
+            remainder = lines.pop()
+            batch = [line.rstrip(b'\r').decode('utf-8') for line in lines]
+            if batch:
+                yield batch
+    except ClientDisconnect:
+        return
+    if remainder.strip():
+        yield [remainder.rstrip(b'\r').decode('utf-8')]
+
+
+def parse_floats(raw: List[object]) -> np.ndarray:
+    """Turn raw cell values into floats; blanks and non-numbers become NaN"""
+    values = np.empty(len(raw), dtype=np.float64)
+    for i, item in enumerate(raw):
+        try:
+            values[i] = float(item)
+        except (TypeError, ValueError):
+            values[i] = np.nan
+    return values
+
+
+def format_floats(values: np.ndarray) -> List[str]:
+    """Render converted values; NaN (unparseable input) becomes an empty cell"""
+    return ['' if value != value else repr(value) for value in values.tolist()]
+
+
+class StreamConverter:
+    """Converts one column of a CSV or NDJSON stream chunk by chunk"""
+
+    def __init__(self, dimension: Dimension, from_unit: str, to_unit: str, column: str,
+                 output_column: Optional[str] = None, precision: Optional[int] = None):
+        self.dimension = dimension
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.column = column
+        self.output_column = output_column or column
+        self.precision = precision
+        # Validates both units before any data is read
+        self.dimension.factors(from_unit, to_unit)
+        self.source_index: Optional[int] = None
+        self.target_index: Optional[int] = None
+
+    def convert_values(self, values: np.ndarray) -> np.ndarray:
+        with np.errstate(over='ignore', invalid='ignore'):
+            result = self.dimension.convert_array(values, self.from_unit, self.to_unit)
+        result[~np.isfinite(result)] = np.nan
+        if self.precision is not None:
+            result = np.round(result, self.precision)
+        return result
+
+    def csv_header(self, line: str) -> str:
+        """Resolve the source/target columns from the header and return the output header"""
+        header = next(csv.reader([line]), [])
+        if self.column in header:
+            self.source_index = header.index(self.column)
+        elif self.column.isdigit() and int(self.column) < len(header):
+            self.source_index = int(self.column)
+        else:
+            raise KeyError(f"Column '{self.column}' not found in CSV header")
+
+        if self.output_column == self.column:
+            self.target_index = self.source_index
+        elif self.output_column in header:
+            self.target_index = header.index(self.output_column)
+        else:
+            self.target_index = len(header)
+            header.append(self.output_column)
+        return self._write_rows([header])
+
+    def csv_batch(self, lines: List[str]) -> str:
+        rows = [row for row in csv.reader(lines) if row]
+        source = self.source_index
+        values = self.convert_values(parse_floats([row[source] if source < len(row) else None for row in rows]))
+        target = self.target_index
+        for row, value in zip(rows, format_floats(values)):
+            if target < len(row):
+                row[target] = value
+            else:
+                row.extend([''] * (target - len(row)))
+                row.append(value)
+        return self._write_rows(rows)
+
+    def ndjson_batch(self, lines: List[str]) -> str:
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            # Bad lines are kept in place so output rows still line up with input rows
+            records.append(record if isinstance(record, dict) else None)
+
+        values = self.convert_values(parse_floats(
+            [record.get(self.column) if record is not None else None for record in records]
+        ))
+        out = []
+        for record, value in zip(records, values.tolist()):
+            if record is None:
+                record = {'error': 'invalid record'}
+            else:
+                record[self.output_column] = None if value != value else value
+            out.append(json.dumps(record, separators=(',', ':')))
+        return '\n'.join(out) + '\n' if out else ''
+
+    @staticmethod
+    def _write_rows(rows: List[List[str]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerows(rows)
+        return buffer.getvalue()
@@ -0,0 +1,254 @@
+import math
+from abc import ABC, abstractmethod
+from decimal import Decimal, localcontext
+from fractions import Fraction
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    # numpy costs ~100ms to import and only the batch paths need it
+    import numpy as np
+
+# Unit definitions: value_in_base = value * scale + offset. Floats are read as
+# the decimal literal they were written as; use Fraction for ratios like 5/9
+UnitDefinition = Tuple[Union[float, Fraction], Union[float, Fraction]]
+
+# Significant digits for exact results (the precision of IEEE decimal128)
+DEFAULT_DIGITS = 34
+
+
+class UnknownUnitError(ValueError):
+    """Raised when a unit is not defined for a dimension"""
+
+
+def to_fraction(value: Union[int, float, str, Decimal, Fraction]) -> Fraction:
+    """Exact rational value of a number; floats are taken as their shortest decimal form"""
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"Value must be a finite number, not {value}")
+        # repr() round-trips, so 0.1 becomes 1/10 rather than 3602879701896397/36028797018963968
+        value = repr(value)
+    if isinstance(value, str):
+        value = value.strip()
+    try:
+        return Fraction(value)
+    except ValueError:
+        raise ValueError(f"Value must be a finite number, not '{value}'") from None
+
+
+def format_exact(value: Fraction, digits: int = DEFAULT_DIGITS, places: Optional[int] = None) -> str:
+    """Render an exact value as a decimal string with at most ``digits`` significant digits,
+    optionally rounded (half-even) to ``places`` decimal places first"""
+    if places is not None:
+        value = round(value, places)
+    with localcontext() as context:
+        context.prec = digits
+        result = Decimal(value.numerator) / Decimal(value.denominator)
+        return format(result.normalize(), 'f') if result else '0'
+
+
+class Converter(ABC):
+    """Conversion operations shared by every kind of unit table"""
+
+    name = 'converter'
+
+    @abstractmethod
+    def factors(self, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        """Return (factor, offset) for a conversion, validating both units"""
+
+    @abstractmethod
+    def exact_factors(self, from_unit: str, to_unit: str) -> Tuple[Fraction, Fraction]:
+        """Exact rational (factor, offset) for a conversion"""
+
+    def convert(self, value: float, from_unit: str, to_unit: str) -> float:
+        """Convert a value between two units"""
+        factor, offset = self.factors(from_unit, to_unit)
+        return value * factor + offset
+
+    def convert_exact(self, value: Union[int, float, str, Decimal, Fraction],
+                      from_unit: str, to_unit: str) -> Fraction:
+        """Convert a value using exact rational arithmetic"""
+        factor, offset = self.exact_factors(from_unit, to_unit)
+        return to_fraction(value) * factor + offset
+
+    def convert_array(self, values: Sequence[float], from_unit: str, to_unit: str) -> "np.ndarray":
+        """Convert many values sharing one (from, to) pair in a single vector operation"""
+        import numpy as np
+        factor, offset = self.factors(from_unit, to_unit)
+        result = np.asarray(values, dtype=np.float64) * factor
+        if offset:
+            result += offset
+        return result
+
+    def convert_pairs(self, values: Sequence[float], from_units: Sequence[str],
+                      to_units: Sequence[str]) -> "np.ndarray":
+        """Convert values where each one has its own (from, to) pair"""
+        import numpy as np
+        count = len(values)
+        factors = np.empty(count, dtype=np.float64)
+        offsets = np.empty(count, dtype=np.float64)
+        lookup = self.factors
+        for i, pair in enumerate(zip(from_units, to_units)):
+            factors[i], offsets[i] = lookup(*pair)
+        return np.asarray(values, dtype=np.float64) * factors + offsets
+
+
+class Dimension(Converter):
+    """A physical dimension with its units and a precomputed conversion matrix"""
+
+    def __init__(self, name: str, base_unit: str, units: Dict[str, UnitDefinition]):
+        if base_unit not in units:
+            raise ValueError(f"Base unit '{base_unit}' is not defined for {name}")
+        self.name = name
+        self.base_unit = base_unit
+        self.units = dict(units)
+        self.exact_units: Dict[str, Tuple[Fraction, Fraction]] = {
+            unit: (to_fraction(scale), to_fraction(offset)) for unit, (scale, offset) in units.items()
+        }
+        # (from, to) -> (factor, offset) so that result = value * factor + offset
+        self.exact_matrix: Dict[Tuple[str, str], Tuple[Fraction, Fraction]] = {}
+        self.matrix: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        for from_unit, (from_scale, from_offset) in self.exact_units.items():
+            for to_unit, (to_scale, to_offset) in self.exact_units.items():
+                factor = from_scale / to_scale
+                offset = (from_offset - to_offset) / to_scale
+                self.exact_matrix[from_unit, to_unit] = (factor, offset)
+                # Rounding the exact ratio once beats dividing two already-rounded floats
+                self.matrix[from_unit, to_unit] = (float(factor), float(offset))
+
+    def factors(self, from_unit: str, to_unit: str) -> Tuple[float, float]:
+        try:
+            return self.matrix[from_unit, to_unit]
+        except KeyError:
+            raise self._unknown(from_unit, to_unit) from None
+
+    def exact_factors(self, from_unit: str, to_unit: str) -> Tuple[Fraction, Fraction]:
+        try:
+            return self.exact_matrix[from_unit, to_unit]
+        except KeyError:
+            raise self._unknown(from_unit, to_unit) from None
+
+    def convert_pairs(self, values: Sequence[float], from_units: Sequence[str],
+                      to_units: Sequence[str]) -> "np.ndarray":
+        import numpy as np
+        count = len(values)
+        factors = np.empty(count, dtype=np.float64)
+        offsets = np.empty(count, dtype=np.float64)
+        lookup = self.matrix.get
+        for i, pair in enumerate(zip(from_units, to_units)):
+            entry = lookup(pair)
+            if entry is None:
+                entry = self.factors(*pair)
+            factors[i], offsets[i] = entry
+        return np.asarray(values, dtype=np.float64) * factors + offsets
+
+    def _unknown(self, from_unit: str, to_unit: str) -> UnknownUnitError:
+        unknown = from_unit if from_unit not in self.units else to_unit
+        return UnknownUnitError(f"Unknown {self.name} unit '{unknown}'. Use: {', '.join(self.units)}")
+
+
+DIMENSIONS: Dict[str, Dimension] = {}
+
+
+def register_dimension(name: str, base_unit: str, units: Dict[str, UnitDefinition]) -> Dimension:
+    """Define a dimension once; its conversion matrix is built immediately"""
+    dimension = Dimension(name, base_unit, units)
+    DIMENSIONS[name] = dimension
+    return dimension
+
+
+def get_dimension(name: str) -> Dimension:
+    """Look up a registered dimension"""
+    try:
+        return DIMENSIONS[name]
+    except KeyError:
+        raise UnknownUnitError(
+            f"Unknown dimension '{name}'. Use: {', '.join(DIMENSIONS)}"
+        ) from None
+
+
+def convert(dimension: str, value: float, from_unit: str, to_unit: str) -> float:
+    """Convert a value between two units of a registered dimension"""
+    return get_dimension(dimension).convert(value, from_unit, to_unit)
+
+
+# Dimension definitions (exact international definitions where they exist)
+register_dimension('length', 'meter', {
+    'millimeter': (0.001, 0.0),
+    'centimeter': (0.01, 0.0),
+    'meter': (1.0, 0.0),
+    'kilometer': (1000.0, 0.0),
+    'inch': (0.0254, 0.0),
+    'foot': (0.3048, 0.0),
+    'yard': (0.9144, 0.0),
+    'mile': (1609.344, 0.0),
+})
+
+register_dimension('weight', 'kilogram', {
+    'milligram': (0.000001, 0.0),
+    'gram': (0.001, 0.0),
+    'kilogram': (1.0, 0.0),
+    'ounce': (0.028349523125, 0.0),
+    'pound': (0.45359237, 0.0),
+})
+
+register_dimension('temperature', 'celsius', {
+    'celsius': (1.0, 0.0),
+    'fahrenheit': (Fraction(5, 9), Fraction(-160, 9)),
+    'kelvin': (1.0, -273.15),
+})
+
+register_dimension('time', 'second', {
+    'millisecond': (0.001, 0.0),
+    'second': (1.0, 0.0),
+    'minute': (60.0, 0.0),
+    'hour': (3600.0, 0.0),
+    'day': (86400.0, 0.0),
+    'week': (604800.0, 0.0),
+})
+
+register_dimension('area', 'square_meter', {
+    'square_millimeter': (0.000001, 0.0),
+    'square_centimeter': (0.0001, 0.0),
+    'square_meter': (1.0, 0.0),
+    'hectare': (10000.0, 0.0),
+    'square_kilometer': (1000000.0, 0.0),
+    'square_inch': (0.00064516, 0.0),
+    'square_foot': (0.09290304, 0.0),
+    'square_yard': (0.83612736, 0.0),
+    'acre': (4046.8564224, 0.0),
+    'square_mile': (2589988.110336, 0.0),
+})
+
+register_dimension('volume', 'liter', {
+    'milliliter': (0.001, 0.0),
+    'liter': (1.0, 0.0),
+    'cubic_meter': (1000.0, 0.0),
+    'teaspoon': (0.00492892159375, 0.0),
+    'tablespoon': (0.01478676478125, 0.0),
+    'fluid_ounce': (0.0295735295625, 0.0),
+    'cup': (0.2365882365, 0.0),
+    'pint': (0.473176473, 0.0),
+    'quart': (0.946352946, 0.0),
+    'gallon': (3.785411784, 0.0),
+})
+
+register_dimension('speed', 'meter_per_second', {
+    'meter_per_second': (1.0, 0.0),
+    'kilometer_per_hour': (Fraction(5, 18), 0.0),
+    'mile_per_hour': (0.44704, 0.0),
+    'foot_per_second': (0.3048, 0.0),
+    'knot': (Fraction(1852, 3600), 0.0),
+})
+
+register_dimension('data', 'byte', {
+    'bit': (0.125, 0.0),
+    'byte': (1.0, 0.0),
+    'kilobyte': (1e3, 0.0),
+    'megabyte': (1e6, 0.0),
+    'gigabyte': (1e9, 0.0),
+    'terabyte': (1e12, 0.0),
+    'kibibyte': (2.0 ** 10, 0.0),
+    'mebibyte': (2.0 ** 20, 0.0),
+    'gibibyte': (2.0 ** 30, 0.0),
+    'tebibyte': (2.0 ** 40, 0.0),
+})